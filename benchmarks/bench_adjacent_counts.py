@@ -0,0 +1,83 @@
+"""
+    Compares the vectorized adjacent mine count pass against the old per-mine loop.
+
+    Run from the repo root:
+        python -m benchmarks.bench_adjacent_counts
+"""
+import argparse
+import time
+import numpy as np
+
+from modules.core.board import Board
+from modules.core.cell import BoardView
+
+
+def legacy_loop_counts(board: Board):
+    """
+        The count pass as Logic.determine_adjacent_mine_count used to do it.
+        Walks every mine and bumps each in-bounds neighbor through a cell view.
+    """
+    view = BoardView(board)
+    for cell_id in np.flatnonzero(board.mines):
+        r, c = board.id_to_grid_coords(int(cell_id))
+
+        for rx, cx in board.cell_neighbors:
+            nr = r + rx
+            nc = c + cx
+
+            if not board.in_bounds(nr, nc):
+                continue
+
+            view[nr][nc].increment_adjacent_mine_count()
+    return
+
+
+def vectorized_counts(board: Board):
+    board.compute_adjacent_mine_counts()
+    return
+
+
+def make_board(size: int, density: float, seed: int) -> Board:
+    board = Board(size, size)
+    rng = np.random.default_rng(seed)
+    num_mines = int(board.num_cells * density)
+    board.place_mines(rng.choice(board.num_cells, num_mines, replace=False))
+    return board
+
+
+def time_best(func, board: Board, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(0, repeat):
+        board.place_mines(np.flatnonzero(board.mines))
+        start = time.perf_counter()
+        func(board)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=500, help="Rows and columns of the square board")
+    parser.add_argument("--densities", type=float, nargs="+", default=[0.01, 0.05, 0.10, 0.15, 0.20, 0.30])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"board {args.size}x{args.size}, best of {args.repeat}")
+    print(f"{'density':>8} {'mines':>9} {'loop (s)':>10} {'vector (s)':>11} {'speedup':>9}")
+
+    for density in args.densities:
+        board = make_board(args.size, density, args.seed)
+
+        loop_time = time_best(legacy_loop_counts, board, args.repeat)
+        expected = board.adjacent.copy()
+
+        vector_time = time_best(vectorized_counts, board, args.repeat)
+        assert np.array_equal(expected, board.adjacent), "count passes disagree"
+
+        print(f"{density:>8.2f} {int(board.mines.sum()):>9} {loop_time:>10.4f} {vector_time:>11.5f} {loop_time / vector_time:>8.0f}x")
+    return
+
+
+if __name__ == "__main__":
+    main()
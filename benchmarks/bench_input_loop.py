@@ -0,0 +1,74 @@
+"""
+    Measures how hard the main loop spins with polled and blocking input.
+
+    Runs the real App loop headless for a fixed time, once idle and once with the left
+    button held (drag mode), for each input mode. Reports loop iterations per second
+    and the CPU time used.
+
+    Run from the repo root:
+        python -m benchmarks.bench_input_loop
+"""
+import argparse
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from main import App
+from modules.event_handler.eventHandler import EventHandler
+
+
+class CountingEventHandler(EventHandler):
+    # Every iteration of App.on_execute asks for exactly one batch of actions
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.iterations = 0
+        return
+
+    def get_actions(self, wait: bool = True):
+        self.iterations += 1
+        return super().get_actions(wait)
+
+
+def run(blocking: bool, drag: bool, seconds: float):
+    app = App()
+    handler = CountingEventHandler(blocking_input=blocking,
+                                   drag_timeout_ms=1000 // app.settings.frame_rate)
+    app.event_handler = handler
+
+    if drag:
+        pygame.event.post(pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=pygame.BUTTON_LEFT, pos=(1, 1)))
+
+    # Ends the loop through the normal QUIT path
+    pygame.time.set_timer(pygame.QUIT, int(seconds * 1000), loops=1)
+
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    app.on_execute()
+    wall = time.perf_counter() - wall_start
+    cpu = time.process_time() - cpu_start
+
+    return handler.iterations / wall, cpu, wall
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seconds", type=float, default=2.0, help="How long to run each case")
+    args = parser.parse_args()
+
+    rows = []
+    for blocking in (False, True):
+        for drag in (False, True):
+            rate, cpu, wall = run(blocking, drag, args.seconds)
+            rows.append(("blocking" if blocking else "poll", "drag" if drag else "idle", rate, cpu, wall))
+
+    print(f"{'input':>9} {'state':>6} {'iters/s':>12} {'cpu (s)':>8} {'wall (s)':>9} {'cpu %':>6}")
+    for mode, state, rate, cpu, wall in rows:
+        print(f"{mode:>9} {state:>6} {rate:>12.0f} {cpu:>8.3f} {wall:>9.3f} {100 * cpu / wall:>6.1f}")
+    return
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+    Compares span (scanline) reveal against per-cell flood fill reveal.
+
+    Every opening on the board is clicked once, in a seeded random order, so both modes
+    open exactly the same cells. Reports the total time, the time of the largest single
+    opening and how many spans the span mode produced.
+
+    Run from the repo root:
+        python -m benchmarks.bench_span_reveal
+"""
+import argparse
+import time
+import numpy as np
+
+from modules.core.board import Board
+
+
+def make_board(size: int, density: float, seed: int) -> Board:
+    board = Board(size, size)
+    rng = np.random.default_rng(seed)
+    board.place_mines(rng.choice(board.num_cells, int(board.num_cells * density), replace=False))
+    board.compute_adjacent_mine_counts()
+    return board
+
+
+def click_order(board: Board, seed: int) -> np.ndarray:
+    zero_ids = np.flatnonzero(board.adjacent == 0)
+    return np.random.default_rng(seed).permutation(zero_ids)
+
+
+def run_mode(board: Board, clicks: np.ndarray, span_mode: bool):
+    board.revealed[:] = False
+    reveal = board.flood_reveal_spans if span_mode else board.flood_reveal
+
+    total = 0.0
+    largest = 0.0
+    results = 0
+    for cell_id in clicks:
+        start = time.perf_counter()
+        res = reveal(int(cell_id))
+        elapsed = time.perf_counter() - start
+        total += elapsed
+        largest = max(largest, elapsed)
+        results += len(res)
+    return total, largest, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=2000, help="Rows and columns of the square board")
+    parser.add_argument("--densities", type=float, nargs="+", default=[0.05, 0.10, 0.15])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"board {args.size}x{args.size}")
+    print(f"{'density':>8} {'opened':>9} {'cell (s)':>9} {'span (s)':>9} {'max cell':>9} {'max span':>9} {'spans':>9} {'speedup':>8}")
+
+    for density in args.densities:
+        board = make_board(args.size, density, args.seed)
+        clicks = click_order(board, args.seed)
+
+        cell_total, cell_max, opened = run_mode(board, clicks, span_mode=False)
+        expected = board.revealed.copy()
+
+        span_total, span_max, spans = run_mode(board, clicks, span_mode=True)
+        assert np.array_equal(expected, board.revealed), "reveal modes disagree"
+
+        print(f"{density:>8.2f} {opened:>9} {cell_total:>9.3f} {span_total:>9.3f} {cell_max:>9.3f} {span_max:>9.3f} {spans:>9} {cell_total / span_total:>7.1f}x")
+    return
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+    Checks ProbabilityEngine against brute force on small boards.
+
+    Each game is played from the middle of a small board, revealing a random safe cell and
+    flagging a random mine between checks. At every check the engine's chances are compared
+    with the ones found by trying every placement of the remaining mines over the unknown
+    cells, and its proven safe cells and mines with the cells that are safe or mines in
+    every placement that fits.
+
+    Run from the repo root:
+        python -m benchmarks.check_probability
+"""
+import argparse
+import itertools
+import sys
+import time
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from modules.settings import Settings
+from modules.core.game import CoreGame
+from modules.core.probability import ProbabilityEngine
+from modules.event_handler.eventEnums import ActionType
+
+
+def brute_force(game: CoreGame) -> Tuple[Dict[int, float], List[int], List[int]]:
+    """
+        :return: Chance of a mine for every unknown cell, and the unknown cells that are
+                 safe and mines in every placement that fits
+    """
+    board = game.grid.cells
+    unknown_mask = ~(board.revealed | board.flagged)
+    unknown = np.flatnonzero(unknown_mask).tolist()
+    mines_left = game.config.num_mines - int(board.flagged.sum())
+
+    # Revealed numbers touching an unknown cell, as (unknown neighbors, mines among them)
+    constraints = []
+    for cell_id in np.flatnonzero(board.revealed).tolist():
+        neighbors = board.neighbor_ids(cell_id)
+        cells = [n for n in neighbors if unknown_mask[n]]
+        if cells:
+            flags = sum(1 for n in neighbors if board.flagged[n])
+            constraints.append((cells, int(board.adjacent[cell_id]) - flags))
+
+    counts = dict.fromkeys(unknown, 0)
+    total = 0
+    for placement in itertools.combinations(unknown, mines_left):
+        mines = set(placement)
+        if all(sum(1 for c in cells if c in mines) == n for cells, n in constraints):
+            total += 1
+            for m in placement:
+                counts[m] += 1
+
+    probs = {cell_id: n / total for cell_id, n in counts.items()}
+    safe = [cell_id for cell_id, n in counts.items() if n == 0]
+    mines = [cell_id for cell_id, n in counts.items() if n == total]
+    return probs, safe, mines
+
+
+def check_game(size: int, num_mines: int, seed: int, max_unknown: int) -> Tuple[int, float]:
+    """
+        :return: Positions checked, and the largest difference in any cell's chance
+    """
+    game = CoreGame(Settings(num_rows=size, num_columns=size, num_mines=num_mines, seed=seed))
+    board = game.grid.cells
+    logic = game.logic
+    engine = ProbabilityEngine(game)
+    rng = np.random.default_rng(seed)
+
+    game.apply_action(logic.cell_action(ActionType.REVEAL, size // 2, size // 2))
+
+    checked = 0
+    worst = 0.0
+    while not game.stats.over:
+        unknown = ~(board.revealed | board.flagged)
+        if int(unknown.sum()) <= max_unknown:
+            expected, safe, mines = brute_force(game)
+            probs = engine.compute()
+
+            interior = [cell_id for cell_id in expected if cell_id not in probs.frontier]
+            got = dict(probs.frontier)
+            got.update(dict.fromkeys(interior, probs.interior))
+            worst = max([worst] + [abs(got[cell_id] - p) for cell_id, p in expected.items()])
+
+            if sorted(probs.safe) != safe or sorted(probs.mines) != mines:
+                raise AssertionError(f"seed {seed}: proven cells differ from brute force")
+            checked += 1
+
+        # A random safe cell and a random mine, both still unknown
+        hidden_safe = np.flatnonzero(unknown & ~board.mines)
+        hidden_mines = np.flatnonzero(unknown & board.mines)
+        cell_id = int(rng.choice(hidden_safe))
+        game.apply_action(logic.cell_action(ActionType.REVEAL, *board.id_to_grid_coords(cell_id)))
+        if len(hidden_mines) and not game.stats.over:
+            cell_id = int(rng.choice(hidden_mines))
+            game.apply_action(logic.cell_action(ActionType.FLAG, *board.id_to_grid_coords(cell_id)))
+
+    return checked, worst
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=6, help="Rows and columns of the square board")
+    parser.add_argument("--mines", type=int, default=8)
+    parser.add_argument("--games", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-unknown", type=int, default=20,
+                        help="Positions with more unknown cells than this are skipped, brute force is too slow")
+    parser.add_argument("--tolerance", type=float, default=1e-9)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    checked = 0
+    worst = 0.0
+    for seed in range(args.seed, args.seed + args.games):
+        n, diff = check_game(args.size, args.mines, seed, args.max_unknown)
+        checked += n
+        worst = max(worst, diff)
+
+    print(f"board {args.size}x{args.size}, {args.mines} mines, {args.games} games")
+    print(f"positions checked  {checked}")
+    print(f"largest difference {worst:.3g}")
+    print(f"time               {time.perf_counter() - start:.1f}s")
+    if worst > args.tolerance:
+        print(f"FAILED, above tolerance {args.tolerance:g}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
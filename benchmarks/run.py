@@ -0,0 +1,345 @@
+"""
+    Benchmark harness for the main game paths.
+
+    Times grid construction, mine placement on the first click, the adjacent count pass,
+    saving and loading, worst case reveals, frame times while a big cascade is spread over
+    frames, full and partial renders and event parsing over a matrix of board sizes and mine
+    densities.
+    Boards are seeded through Settings.seed so runs are reproducible. Runs headless with
+    the dummy SDL video driver.
+
+    Run from the repo root:
+        python -m benchmarks.run --output before.json
+        python -m benchmarks.run --output after.json
+        python -m benchmarks.run compare before.json after.json
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List, Optional
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import numpy as np
+import pygame
+
+from modules.settings import Settings
+from modules.core.config import Config
+from modules.core.grid import Grid
+from modules.core.game import CoreGame
+from modules.core import savefile
+from modules.game.config import Config as Game_Config
+from modules.game.render import Render
+from modules.event_handler.eventConfig import EventConfig
+from modules.event_handler.eventParser import EventParser
+from modules.event_handler.eventState import State
+from modules.event_handler.eventEnums import ActionType
+
+
+FORMAT_VERSION = 1
+
+
+def measure(func: Callable[[], None], repeat: int, setup: Optional[Callable[[], None]] = None) -> Dict[str, float]:
+    """
+        Runs setup (untimed) then func, repeat times.
+    """
+    times: List[float] = []
+    for _ in range(0, repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return {"best": min(times), "median": statistics.median(times), "repeat": repeat}
+
+
+def make_settings(size: int, density: float, seed: int) -> Settings:
+    return Settings(num_rows=size, num_columns=size, num_mines=int(size * size * density), seed=seed)
+
+
+def place_mines(game: CoreGame):
+    # Mines are only placed on the first click, take it in the middle of the board
+    cells = game.grid.cells
+    game.grid.place_mines(cells.grid_coords_to_id(cells.num_rows // 2, cells.num_columns // 2))
+    return
+
+
+def bench_grid_construction(size: int, density: float, seed: int, repeat: int):
+    settings = make_settings(size, density, seed)
+    return measure(lambda: Grid(Config(settings)), repeat)
+
+
+def bench_first_click_placement(size: int, density: float, seed: int, repeat: int):
+    game = CoreGame(make_settings(size, density, seed))
+    return measure(lambda: place_mines(game), repeat)
+
+
+def bench_adjacent_counts(size: int, density: float, seed: int, repeat: int):
+    game = CoreGame(make_settings(size, density, seed))
+    place_mines(game)
+    return measure(game.logic.determine_adjacent_mine_count, repeat)
+
+
+def bench_reveal(size: int, seed: int, repeat: int, spans: bool):
+    # No mines, so one click opens the whole board
+    game = CoreGame(make_settings(size, 0.0, seed))
+    cells = game.grid.cells
+
+    def reset():
+        cells.revealed[:] = False
+
+    if spans:
+        return measure(lambda: game.logic._reveal_cell_spans(0, 0), repeat, reset)
+    return measure(lambda: game.logic._reveal_cell_bfs(0, 0), repeat, reset)
+
+
+def bench_save_load(size: int, density: float, seed: int, repeat: int, load: bool):
+    game = CoreGame(make_settings(size, density, seed))
+    place_mines(game)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.msav")
+        savefile.save_game(game, path)
+        if load:
+            return measure(lambda: savefile.load_into(game, path), repeat)
+        return measure(lambda: savefile.save_game(game, path), repeat)
+
+
+def bench_restart(screen: pygame.Surface, size: int, density: float, seed: int, repeat: int):
+    """
+        Restart of a played game, through to the first frame of the new one.
+    """
+    settings = make_settings(size, density, seed)
+    config = Game_Config(screen, settings)
+    game = CoreGame(settings, config)
+    render = Render(game.grid, config)
+    game.add_observer(render)
+
+    def setup():
+        # A game in progress, with its first cascade open
+        game.logic.update_board(game.logic.cell_action(ActionType.REVEAL, size // 2, size // 2))
+        render.render()
+
+    def restart():
+        game.restart()
+        render.render()
+
+    return measure(restart, repeat, setup)
+
+
+def bench_cascade_frames(screen: pygame.Surface, size: int, seed: int, budget_ms: float,
+                         spans: bool) -> Dict[str, float]:
+    """
+        Frame times while a reveal opens the whole of an empty board, each frame doing
+        budget_ms of reveal work and a render with as much again for the zoomed out
+        picture, as the game loop does.
+    """
+    settings = make_settings(size, 0.0, seed)
+    settings.span_reveal = spans
+    config = Game_Config(screen, settings)
+    game = CoreGame(settings, config)
+    place_mines(game)
+    render = Render(game.grid, config)
+    game.add_observer(render)
+    game.logic.reveal_budget = budget_ms / 1000
+    render.update_budget = budget_ms / 1000
+    render.render()
+
+    frames: List[float] = []
+    start = time.perf_counter()
+    game.apply_action(game.logic.cell_action(ActionType.REVEAL, size // 2, size // 2))
+    render.render()
+    frames.append(time.perf_counter() - start)
+    while game.logic.busy or render.busy:
+        start = time.perf_counter()
+        game.logic.continue_reveal()
+        render.render()
+        frames.append(time.perf_counter() - start)
+
+    return {
+        "best": min(frames),
+        "median": statistics.median(frames),
+        "p95": float(np.percentile(frames, 95)),
+        "p99": float(np.percentile(frames, 99)),
+        "max": max(frames),
+        "frames": len(frames),
+        "total": sum(frames),
+    }
+
+
+def bench_render(screen: pygame.Surface, size: int, density: float, seed: int, repeat: int, full: bool,
+                 cell_size: Optional[int] = None):
+    settings = make_settings(size, density, seed)
+    # Fixed size cells show only part of a large board, the rest is culled
+    settings.cell_width = settings.cell_height = cell_size
+    config = Game_Config(screen, settings)
+    game = CoreGame(settings, config)
+    place_mines(game)
+    render = Render(game.grid, config)
+    render.render()
+
+    cells = game.grid.cells
+    rng = np.random.default_rng(seed)
+
+    if full:
+        # Worst case, every cell differs from the unrevealed background
+        cells.revealed[:] = True
+
+        def setup():
+            render.request_full_redraw()
+    else:
+        # One percent of the board changed since the last frame
+        changed = rng.choice(cells.num_cells, max(1, cells.num_cells // 100), replace=False).tolist()
+        cells.revealed[changed] = True
+
+        def setup():
+            render.cells_changed(changed)
+
+    return measure(render.render, repeat, setup)
+
+
+def bench_event_parsing(repeat: int, num_events: int = 20000):
+    state = State()
+    parser = EventParser(config=EventConfig(), s=state)
+
+    events = []
+    for i in range(0, num_events // 2):
+        pos = (i % 500, i % 400)
+        events.append(pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=pygame.BUTTON_LEFT, pos=pos))
+        events.append(pygame.event.Event(pygame.MOUSEBUTTONUP, button=pygame.BUTTON_LEFT, pos=pos))
+
+    def parse_all():
+        for e in events:
+            parser.set_current_event(e)
+            parser.get_action_from_event()
+
+    res = measure(parse_all, repeat)
+    res["events_per_second"] = num_events / res["median"]
+    return res
+
+
+def run(args) -> Dict:
+    pygame.init()
+    screen = pygame.display.set_mode((Settings.grid_width, Settings.grid_height))
+
+    results: Dict[str, Dict[str, float]] = {}
+
+    def record(name: str, res: Dict[str, float]):
+        results[name] = res
+        line = f"{name:<52} median {res['median'] * 1000:>10.3f} ms   best {res['best'] * 1000:>10.3f} ms"
+        if "p95" in res:
+            line += (f"   p95 {res['p95'] * 1000:.3f} ms   p99 {res['p99'] * 1000:.3f} ms"
+                     f"   max {res['max'] * 1000:.3f} ms   frames {res['frames']}")
+        print(line, flush=True)
+
+    for size in args.sizes:
+        for density in args.densities:
+            tag = f"size={size}/density={density}"
+            record(f"grid_construction/{tag}", bench_grid_construction(size, density, args.seed, args.repeat))
+            record(f"first_click_placement/{tag}", bench_first_click_placement(size, density, args.seed, args.repeat))
+            record(f"adjacent_counts/{tag}", bench_adjacent_counts(size, density, args.seed, args.repeat))
+            record(f"save/{tag}", bench_save_load(size, density, args.seed, args.repeat, load=False))
+            record(f"load/{tag}", bench_save_load(size, density, args.seed, args.repeat, load=True))
+            record(f"restart/{tag}", bench_restart(screen, size, density, args.seed, args.repeat))
+            record(f"render_full/{tag}", bench_render(screen, size, density, args.seed, args.repeat, full=True))
+            record(f"render_partial/{tag}", bench_render(screen, size, density, args.seed, args.repeat, full=False))
+            record(f"render_full_zoomed/{tag}", bench_render(screen, size, density, args.seed, args.repeat, full=True,
+                                                             cell_size=16))
+
+        record(f"reveal_bfs_open_board/size={size}", bench_reveal(size, args.seed, args.repeat, spans=False))
+        record(f"reveal_spans_open_board/size={size}", bench_reveal(size, args.seed, args.repeat, spans=True))
+        record(f"cascade_frames/size={size}/budget_ms=4",
+               bench_cascade_frames(screen, size, args.seed, 4.0, spans=False))
+        record(f"cascade_frames_spans/size={size}/budget_ms=4",
+               bench_cascade_frames(screen, size, args.seed, 4.0, spans=True))
+
+    record("event_parsing", bench_event_parsing(args.repeat))
+
+    pygame.quit()
+
+    return {
+        "format_version": FORMAT_VERSION,
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": sys.version.split()[0],
+            "numpy": np.__version__,
+            "pygame": pygame.version.ver,
+            "platform": platform.platform(),
+            "sizes": args.sizes,
+            "densities": args.densities,
+            "seed": args.seed,
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+
+
+def compare(old_path: str, new_path: str, threshold: float, metric: str) -> int:
+    """
+        Compares two result files on metric ("best" or "median").
+
+        :return: Number of benchmarks that got slower by more than threshold
+    """
+    with open(old_path) as f:
+        old = json.load(f)["results"]
+    with open(new_path) as f:
+        new = json.load(f)["results"]
+
+    regressions = 0
+    print(f"{'benchmark (' + metric + ')':<52} {'old (ms)':>10} {'new (ms)':>10} {'change':>8}")
+    for name in sorted(set(old) | set(new)):
+        if name not in old or name not in new:
+            print(f"{name:<52} {'only in ' + ('new' if name in new else 'old'):>30}")
+            continue
+
+        before = old[name][metric]
+        after = new[name][metric]
+        change = (after - before) / before if before > 0 else 0.0
+
+        flag = ""
+        if change > threshold:
+            flag = "  REGRESSION"
+            regressions += 1
+        elif change < -threshold:
+            flag = "  faster"
+
+        print(f"{name:<52} {before * 1000:>10.3f} {after * 1000:>10.3f} {change:>+7.1%}{flag}")
+
+    print(f"\n{regressions} regression(s) above {threshold:.0%}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest="command")
+
+    cmp_parser = sub.add_parser("compare", help="Flag regressions between two result files")
+    cmp_parser.add_argument("old")
+    cmp_parser.add_argument("new")
+    cmp_parser.add_argument("--threshold", type=float, default=0.10, help="Relative slowdown that counts as a regression")
+    cmp_parser.add_argument("--metric", choices=["best", "median"], default="best",
+                            help="Best of the repeats is least affected by noise on short benchmarks")
+
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 500, 1000])
+    parser.add_argument("--densities", type=float, nargs="+", default=[0.05, 0.15, 0.25])
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", default=None, help="Write results to this JSON file")
+    args = parser.parse_args()
+
+    if args.command == "compare":
+        sys.exit(1 if compare(args.old, args.new, args.threshold, args.metric) else 0)
+
+    results = run(args)
+    if args.output is not None:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+    return
+
+
+if __name__ == "__main__":
+    main()
@@ -2,8 +2,9 @@ import pygame
 from modules.event_handler.eventHandler import EventHandler
 from modules.settings import Settings
 from modules.game.game import Game
-from typing import Tuple
+from typing import Tuple, List
 import random
+import time
 from modules.event_handler.eventEnums import ActionType
 from modules.event_handler.eventAction import Action
 
@@ -26,7 +27,12 @@ class App:
         self.clock: pygame.time.Clock = pygame.time.Clock()
 
         self.game: Game = Game(self._display_surf)
-        self.event_handler: EventHandler = EventHandler()
+        self.event_handler: EventHandler = EventHandler(blocking_input=self.settings.blocking_input,
+                                                        drag_timeout_ms=1000 // self.settings.frame_rate)
+
+        # Start and action count of the frame being worked on, for the performance overlay
+        self._frame_start: float = time.perf_counter()
+        self._frame_actions: int = 0
 
         self._running = True
         pygame.display.flip()
@@ -42,22 +48,30 @@ class App:
             return 1
         return 0
     
-    def on_loop(self, action: Action):
-        self.game.apply_action(action)
+    def on_loop(self, actions: List[Action]):
+        self._frame_start = time.perf_counter()
+        self._frame_actions = len(actions)
+        self.game.apply_actions(actions)
+        self.game.update()
         return
     
     def on_render(self):
-        self.game.game_render()
-        pygame.display.flip()
+        # Only push the areas that changed this frame to the display
+        dirty_rects = self.game.game_render()
+        if dirty_rects:
+            pygame.display.update(dirty_rects)
+        # Before the tick, which only waits out the frame rate
+        self.game.record_frame(time.perf_counter() - self._frame_start, self._frame_actions)
         self.clock.tick(self.settings.frame_rate)
         return
     
     def on_cleanup(self):
+        self.game.close()
         pygame.quit()
 
     def on_execute(self):
         
-        next_action: Action
+        next_actions: List[Action]
 
         if self.on_init() == False:
             self._running = False
@@ -66,16 +80,21 @@ class App:
         self.on_render()
 
         while( self._running ):
-            next_action = self.event_handler.get_action()
+            # Everything that came in since the last frame is applied before one render.
+            # While the game is busy, e.g. with a big cascade, frames keep coming without input
+            busy = self.game.busy
+            next_actions = self.event_handler.get_actions(wait=not busy)
             
-            if next_action.action == ActionType.QUIT:
-                self._running = False
-                continue
+            for i, a in enumerate(next_actions):
+                if a.action == ActionType.QUIT:
+                    next_actions = next_actions[:i]
+                    self._running = False
+                    break
             
-            if next_action.action == ActionType.NONE:
+            if len(next_actions) == 0 and not busy:
                 continue
             
-            self.on_loop(next_action)
+            self.on_loop(next_actions)
             self.on_render()
 
         self.on_cleanup()
@@ -0,0 +1,199 @@
+"""
+    Append-only log of every action applied to a game, and a replay engine for it.
+
+    Log format, little endian:
+
+        magic, version
+        settings, as JSON, with the seed the game actually used
+        screen size the actions' pixel coordinates refer to
+        mine ids handed to the game, e.g. a no-guess board, or -1 when there are none
+        ENTRY entries: milliseconds since the log started, ActionType value, x, y
+        END entry and the board_hash() of the final board, once the game is closed
+
+    A log cut short by a crash has no END entry. It still replays, there is just no
+    final board to check against.
+"""
+import hashlib
+import json
+import struct
+import time
+from dataclasses import asdict, dataclass, fields
+from typing import Optional, Tuple
+
+import numpy as np
+
+from ..settings import Settings
+from ..event_handler.eventAction import Action
+from ..event_handler.eventEnums import ActionType
+from .board import Board
+from .config import Config
+from .game import CoreGame
+
+
+MAGIC = b"MSWL"
+FORMAT_VERSION = 1
+
+_PREFIX = struct.Struct("<4sHI")     # magic, version, settings JSON length
+_SCREEN = struct.Struct("<II")
+_MINE_COUNT = struct.Struct("<q")
+
+ENTRY = np.dtype([("ms", "<u4"), ("code", "u1"), ("x", "<i4"), ("y", "<i4")])
+
+# ActionType values start at 1, so 0 is free to mark the end of the log
+_END_CODE = 0
+DIGEST_SIZE = 32
+
+
+def board_hash(board: Board) -> bytes:
+    """
+        Digest of the mine, revealed and flagged state of every cell.
+    """
+    h = hashlib.blake2b(digest_size=DIGEST_SIZE)
+    h.update(struct.pack("<II", board.num_rows, board.num_columns))
+    h.update(board.mines.tobytes())
+    h.update(board.revealed.tobytes())
+    h.update(board.flagged.tobytes())
+    return h.digest()
+
+
+class ActionRecorder():
+    """
+        Writes an action log while a game is played.
+
+        Entries go through a buffered file, so recording costs a struct pack per action.
+        The settings must carry a concrete seed, or the replay would get other mines.
+    """
+    def __init__(self, path: str, settings: Settings, screen_size: Tuple[int, int],
+                 mine_ids: Optional[np.ndarray] = None):
+
+        assert settings.seed is not None, "Recorded games need a seed to replay"
+
+        self._file = open(path, "wb")
+        self._start: float = time.monotonic()
+        self._entry = struct.Struct("<IBii")
+
+        settings_json = json.dumps(asdict(settings)).encode()
+        self._file.write(_PREFIX.pack(MAGIC, FORMAT_VERSION, len(settings_json)))
+        self._file.write(settings_json)
+        self._file.write(_SCREEN.pack(*screen_size))
+        if mine_ids is None:
+            self._file.write(_MINE_COUNT.pack(-1))
+        else:
+            mine_ids = np.asarray(mine_ids, dtype="<i8")
+            self._file.write(_MINE_COUNT.pack(len(mine_ids)))
+            self._file.write(mine_ids.tobytes())
+        return
+
+    def record(self, a: Action):
+        ms = int((time.monotonic() - self._start) * 1000)
+        self._file.write(self._entry.pack(ms, a.action.value, a.coords[0], a.coords[1]))
+        return
+
+    def close(self, game: Optional[CoreGame] = None):
+        """
+            :param game: If given, the END entry and final board hash are written
+        """
+        if game is not None:
+            self._file.write(self._entry.pack(0, _END_CODE, 0, 0))
+            self._file.write(board_hash(game.grid.cells))
+        self._file.close()
+        return
+
+
+@dataclass
+class RecordedGame:
+    settings: Settings
+    screen_size: Tuple[int, int]
+    mine_ids: Optional[np.ndarray]
+    # Structured array of ENTRY
+    entries: np.ndarray
+    # None if the log has no END entry
+    final_hash: Optional[bytes]
+
+    @property
+    def duration(self) -> float:
+        return float(self.entries["ms"][-1]) / 1000 if len(self.entries) else 0.0
+
+
+def read_log(path: str) -> RecordedGame:
+    with open(path, "rb") as f:
+        data = f.read()
+
+    if len(data) < _PREFIX.size:
+        raise ValueError("Not an action log, too short for the header")
+    magic, version, settings_len = _PREFIX.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError("Not an action log, bad magic")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Unsupported action log version {version}, expected {FORMAT_VERSION}")
+    offset = _PREFIX.size
+
+    # Unknown keys are settings from a newer version, skipped
+    saved = json.loads(data[offset:offset + settings_len])
+    settings = Settings(**{f.name: saved[f.name] for f in fields(Settings) if f.name in saved})
+    offset += settings_len
+
+    screen_size = _SCREEN.unpack_from(data, offset)
+    offset += _SCREEN.size
+
+    (num_mine_ids,) = _MINE_COUNT.unpack_from(data, offset)
+    offset += _MINE_COUNT.size
+    mine_ids = None
+    if num_mine_ids >= 0:
+        mine_ids = np.frombuffer(data, dtype="<i8", count=num_mine_ids, offset=offset).astype(np.intp)
+        offset += 8 * num_mine_ids
+
+    # A partly written last entry, from a crash, is dropped
+    count = (len(data) - offset) // ENTRY.itemsize
+    entries = np.frombuffer(data, dtype=ENTRY, count=count, offset=offset)
+
+    final_hash = None
+    end = np.flatnonzero(entries["code"] == _END_CODE)
+    if len(end):
+        digest_at = offset + (int(end[0]) + 1) * ENTRY.itemsize
+        final_hash = data[digest_at:digest_at + DIGEST_SIZE]
+        entries = entries[:end[0]]
+
+    return RecordedGame(settings, screen_size, mine_ids, entries, final_hash)
+
+
+@dataclass
+class ReplayResult:
+    game: CoreGame
+    actions: int
+    seconds: float
+    # None when the log had no final hash to check against
+    matched: Optional[bool]
+
+
+def replay(recorded: RecordedGame, check: bool = True) -> ReplayResult:
+    """
+        Re-applies every logged action to a new headless game, as fast as it can.
+
+        :param check: Compare the final board with the logged hash, if there is one
+    """
+    start = time.perf_counter()
+    game = CoreGame(recorded.settings, Config(recorded.settings, recorded.screen_size), recorded.mine_ids)
+
+    # ActionType lookups are done once per code, not once per entry
+    types = {t.value: t for t in ActionType}
+    codes = recorded.entries["code"].tolist()
+    xs = recorded.entries["x"].tolist()
+    ys = recorded.entries["y"].tolist()
+
+    for code, x, y in zip(codes, xs, ys):
+        game.apply_action(Action(action=types[code], coords=(x, y)))
+
+    matched = None
+    if check and recorded.final_hash is not None:
+        matched = board_hash(game.grid.cells) == recorded.final_hash
+    return ReplayResult(game, len(codes), time.perf_counter() - start, matched)
+
+
+def replay_file(path: str, check: bool = True) -> Tuple[str, int, float, Optional[bool]]:
+    """
+        Replays one log. Returns (path, actions, seconds, matched), cheap to send back
+        from a worker process.
+    """
+    result = replay(read_log(path), check)
+    return path, result.actions, result.seconds, result.matched
@@ -0,0 +1,617 @@
+import numpy as np
+from typing import Iterable, List, Optional, Tuple
+
+from .enums import cell_neighbor_increments
+
+
+# Value stored in Board.adjacent for mine cells. Doubles as the index of
+# RevealColors.MINE in the reveal color lookup table.
+MINE_ADJACENT_VALUE: int = 9
+
+
+def _find(buf, value: int, start: int, stop: int) -> int:
+    # Index of the first byte equal to value in buf[start:stop], stop if there is none
+    i = buf.find(value, start, stop)
+    return stop if i < 0 else i
+
+
+def _rfind(buf, value: int, start: int, stop: int) -> int:
+    # One past the index of the last byte equal to value in buf[start:stop], start if there is none
+    return buf.rfind(value, start, stop) + 1 or start
+
+
+class ZeroRuns:
+    """
+        Every horizontal run of zero cells on a board, grouped into openings.
+
+        Two runs belong to the same opening when they sit on neighboring rows and touch,
+        diagonals included. Openings are labeled once per board with vectorized union-find,
+        so revealing a large opening is a handful of numpy passes over its bounding box
+        instead of a flood fill.
+
+        Only depends on which cells are zero, flags and reveals are not taken into account.
+    """
+
+    def __init__(self, zero: np.ndarray):
+
+        rows, cols = zero.shape
+
+        # Runs, in row major order. Ends are exclusive
+        padded = np.zeros((rows, cols + 2), dtype=np.int8)
+        padded[:, 1:-1] = zero
+        edges = np.diff(padded, axis=1)
+        run_row, run_start = np.nonzero(edges == 1)
+        _, run_end = np.nonzero(edges == -1)
+
+        self.run_row: np.ndarray = run_row.astype(np.int32)
+        self.run_start: np.ndarray = run_start.astype(np.int32)
+        self.run_end: np.ndarray = run_end.astype(np.int32)
+        self.run_start_ids: np.ndarray = run_row.astype(np.int64) * cols + run_start
+
+        label = self._label(rows, cols)
+
+        # Group the runs of each opening together, keeping row major order inside a group
+        self.order: np.ndarray = np.argsort(label, kind="stable").astype(np.int32)
+        sorted_label = label[self.order]
+        self.offsets: np.ndarray = np.flatnonzero(np.diff(sorted_label, prepend=-1, append=-2))
+
+        # Opening index of every run
+        self.run_opening: np.ndarray = np.empty(len(label), dtype=np.int32)
+        self.run_opening[self.order] = np.repeat(np.arange(len(self.offsets) - 1, dtype=np.int32), np.diff(self.offsets))
+
+        group_starts = self.offsets[:-1]
+        if len(group_starts):
+            self.size: np.ndarray = np.add.reduceat((self.run_end - self.run_start)[self.order], group_starts)
+            self.first_row: np.ndarray = np.minimum.reduceat(self.run_row[self.order], group_starts)
+            self.last_row: np.ndarray = np.maximum.reduceat(self.run_row[self.order], group_starts)
+            self.first_col: np.ndarray = np.minimum.reduceat(self.run_start[self.order], group_starts)
+            self.last_col: np.ndarray = np.maximum.reduceat(self.run_end[self.order], group_starts)
+        return
+
+    def _label(self, rows: int, cols: int) -> np.ndarray:
+        """
+            Union-find over the runs, done with whole array hooking and pointer jumping.
+
+            :return: Root run index for every run. Runs of one opening share a root
+        """
+        num_runs = len(self.run_row)
+
+        # A run on row r touches every run on row r + 1 that overlaps [start - 1, end + 1).
+        # Keys order runs by (row, column) so one searchsorted finds each range.
+        width = np.int64(cols + 2)
+        start_keys = self.run_row.astype(np.int64) * width + self.run_start
+        end_keys = self.run_row.astype(np.int64) * width + self.run_end
+        next_row = (self.run_row.astype(np.int64) + 1) * width
+
+        lo = np.searchsorted(end_keys, next_row + self.run_start, side="left")
+        hi = np.searchsorted(start_keys, next_row + self.run_end, side="right")
+        counts = np.maximum(hi - lo, 0)
+
+        total = int(counts.sum())
+        u = np.repeat(np.arange(num_runs), counts)
+        v = np.repeat(lo - (np.cumsum(counts) - counts), counts) + np.arange(total)
+
+        parent = np.arange(num_runs)
+        while True:
+            pu = parent[u]
+            pv = parent[v]
+            crossing = pu != pv
+            if not crossing.any():
+                break
+
+            # Hook the larger root under the smaller one, then flatten every tree
+            np.minimum.at(parent, np.maximum(pu, pv)[crossing], np.minimum(pu, pv)[crossing])
+            while True:
+                grand = parent[parent]
+                if np.array_equal(grand, parent):
+                    break
+                parent = grand
+
+        return parent
+
+    def opening_of(self, cell_id: int) -> int:
+        # cell_id must be a zero cell
+        return int(self.run_opening[np.searchsorted(self.run_start_ids, cell_id, side="right") - 1])
+
+
+class PendingReveal:
+    """
+        A flood reveal that can be run a piece at a time, see Board.flood_reveal().
+
+        Cells are marked revealed as they are found, and step() returns exactly the cells
+        it marked, so the board never holds a revealed cell nobody was told about. What
+        is left is a stack of zero cells whose neighbors have not been looked at yet.
+    """
+
+    def __init__(self, board: "Board", cell_id: int):
+
+        self._board: "Board" = board
+        self._first: Optional[int] = None
+        self._stack: List[int] = []
+
+        if not (board._revealed_buf[cell_id] or board._flagged_buf[cell_id]):
+            board._revealed_buf[cell_id] = 1
+            self._first = cell_id
+            if board._adjacent_buf[cell_id] == 0:
+                self._stack.append(cell_id)
+        return
+
+    @property
+    def done(self) -> bool:
+        return self._first is None and not self._stack
+
+    def step(self, max_cells: Optional[int] = None) -> List[int]:
+        """
+            Carries on with the reveal until it is done, or max_cells zero cells have had
+            their neighbors looked at. Late in a cascade most of them open nothing new, so
+            this bounds the work rather than the cells revealed.
+
+            :return: Ids of the newly revealed cells, in reveal order
+        """
+        board = self._board
+        revealed = board._revealed_buf
+        flagged = board._flagged_buf
+        adjacent = board._adjacent_buf
+
+        rows = board.num_rows
+        cols = board.num_columns
+        neighbors = board.cell_neighbors
+        stack = self._stack
+        limit = max_cells if max_cells is not None else board.num_cells
+
+        opened: List[int] = []
+        if self._first is not None:
+            opened.append(self._first)
+            self._first = None
+
+        while stack and limit > 0:
+            limit -= 1
+            r, c = divmod(stack.pop(), cols)
+
+            for dr, dc in neighbors:
+                nr = r + dr
+                nc = c + dc
+                if nr < 0 or nr >= rows or nc < 0 or nc >= cols:
+                    continue
+
+                n_id = nr * cols + nc
+                if revealed[n_id] or flagged[n_id]:
+                    continue
+
+                revealed[n_id] = 1
+                opened.append(n_id)
+                if adjacent[n_id] == 0:
+                    stack.append(n_id)
+
+        return opened
+
+
+class PendingSpanReveal:
+    """
+        A span reveal that can be run a piece at a time, see Board.flood_reveal_spans().
+
+        Numbered cells and small openings are revealed when it is made. A large opening is
+        worked through a band of rows at a time, first checking every band for cells that
+        are already revealed or flagged, then revealing the bands top to bottom. Should the
+        check find any, part of the opening has been cut off by flags and a scanline fill
+        from the clicked cell takes over, a run at a time.
+
+        As with PendingReveal, step() returns exactly the spans it marked revealed.
+    """
+    # Numpy passes over a band cost about this much less per cell than the scanline fill,
+    # so a band may hold this many cells for every cell step() is allowed
+    BAND_CELLS_PER_CELL: int = 16
+
+    def __init__(self, board: "Board", cell_id: int):
+
+        self._board: "Board" = board
+        self._cell_id: int = cell_id
+        # Spans revealed when made, handed out by the first step()
+        self._first: List[Tuple[int, int, int]] = []
+        # Zero cells the scanline fill still has to grow runs from
+        self._seeds: List[int] = []
+
+        # Bounding box of the opening grown by one cell for the border, rows [r0, r1) and
+        # columns [c0, c1). Rows from _check_row and _reveal_row on have not been checked
+        # and revealed yet
+        self._r0 = self._r1 = self._c0 = self._c1 = 0
+        self._check_row: int = 0
+        self._reveal_row: int = 0
+
+        # Last band of the opening painted, (first row, end row, cells). Saves painting it
+        # twice when one band covers the whole opening
+        self._inside: Optional[Tuple[int, int, np.ndarray]] = None
+
+        if board._revealed_buf[cell_id] or board._flagged_buf[cell_id]:
+            return
+
+        if not board._zero_mask[cell_id]:
+            board._revealed_buf[cell_id] = 1
+            r, c = divmod(cell_id, board.num_columns)
+            self._first.append((r, c, c + 1))
+            return
+
+        runs = board.zero_runs()
+        opening = runs.opening_of(cell_id)
+        if runs.size[opening] < board.SPAN_VECTOR_CUTOFF:
+            self._first = board._ids_to_spans(board.flood_reveal(cell_id))
+            return
+
+        # Runs of the opening, in row major order
+        self._group: np.ndarray = runs.order[runs.offsets[opening]:runs.offsets[opening + 1]]
+        self._group_rows: np.ndarray = runs.run_row[self._group]
+
+        self._r0 = max(int(runs.first_row[opening]) - 1, 0)
+        self._r1 = min(int(runs.last_row[opening]) + 2, board.num_rows)
+        self._c0 = max(int(runs.first_col[opening]) - 1, 0)
+        self._c1 = min(int(runs.last_col[opening]) + 1, board.num_columns)
+        self._check_row = self._reveal_row = self._r0
+        return
+
+    @property
+    def done(self) -> bool:
+        return not self._first and not self._seeds and self._reveal_row >= self._r1
+
+    def step(self, max_cells: Optional[int] = None) -> List[Tuple[int, int, int]]:
+        """
+            Carries on with the reveal until it is done, or about max_cells cells have been
+            looked at by the scanline fill, or BAND_CELLS_PER_CELL times as many covered
+            by bands.
+
+            :return: Disjoint (row, start column, end column) spans of the newly revealed
+                     cells, end column exclusive
+        """
+        spans = self._first
+        self._first = []
+        limit = max_cells if max_cells is not None else self._board.num_cells
+
+        width = self._c1 - self._c0
+        band = max(1, limit * self.BAND_CELLS_PER_CELL // max(width, 1))
+        while self._check_row < self._r1 and limit > 0:
+            a = self._check_row
+            b = min(a + band, self._r1)
+            if self._touched(a, b):
+                # Flags have cut the opening up, only a fill can tell what is still reachable
+                self._check_row = self._reveal_row = self._r1
+                self._seeds.append(self._cell_id)
+                break
+            self._check_row = b
+            limit -= max(1, (b - a) * width // self.BAND_CELLS_PER_CELL)
+
+        while self._check_row >= self._r1 and self._reveal_row < self._r1 and limit > 0:
+            a = self._reveal_row
+            b = min(a + band, self._r1)
+            self._reveal_band(a, b, spans)
+            self._reveal_row = b
+            limit -= max(1, (b - a) * width // self.BAND_CELLS_PER_CELL)
+
+        if self._seeds and limit > 0:
+            self._scanline(limit, spans)
+        return spans
+
+    def _paint(self, a: int, b: int) -> np.ndarray:
+        """
+            :return: Cells of the opening on rows [a, b), columns [c0, c1) of the bounding box
+        """
+        if self._inside is not None and self._inside[:2] == (a, b):
+            return self._inside[2]
+
+        runs = self._board.zero_runs()
+        lo, hi = np.searchsorted(self._group_rows, [a, b])
+        group = self._group[lo:hi]
+
+        # Runs on a row never touch, so no index repeats
+        edges = np.zeros((b - a, self._c1 - self._c0 + 1), dtype=np.int8)
+        edges[runs.run_row[group] - a, runs.run_start[group] - self._c0] = 1
+        edges[runs.run_row[group] - a, runs.run_end[group] - self._c0] = -1
+        inside = np.cumsum(edges, axis=1, dtype=np.int8)[:, :-1].astype(np.bool_)
+
+        self._inside = (a, b, inside)
+        return inside
+
+    def _window(self, a: int, b: int) -> Tuple[np.ndarray, np.ndarray]:
+        board = self._board
+        shape = (board.num_rows, board.num_columns)
+        return (board.revealed.reshape(shape)[a:b, self._c0:self._c1],
+                board.flagged.reshape(shape)[a:b, self._c0:self._c1])
+
+    def _touched(self, a: int, b: int) -> bool:
+        revealed, flagged = self._window(a, b)
+        return bool((self._paint(a, b) & (revealed | flagged)).any())
+
+    def _reveal_band(self, a: int, b: int, spans: List[Tuple[int, int, int]]):
+        """
+            Reveals rows [a, b) of the opening and its numbered border, the rows either side
+            are painted too for the border they add.
+        """
+        pa = max(a - 1, self._r0)
+        pb = min(b + 1, self._r1)
+        inside = self._paint(pa, pb)
+
+        # 3x3 dilation adds the numbered border
+        opened = inside.copy()
+        opened[1:] |= inside[:-1]
+        opened[:-1] |= inside[1:]
+        grown = opened.copy()
+        opened[:, 1:] |= grown[:, :-1]
+        opened[:, :-1] |= grown[:, 1:]
+        opened = opened[a - pa:b - pa]
+
+        revealed, flagged = self._window(a, b)
+        opened &= ~(revealed | flagged)
+        revealed |= opened
+
+        padded = np.zeros((b - a, self._c1 - self._c0 + 2), dtype=np.int8)
+        padded[:, 1:-1] = opened
+        span_edges = np.diff(padded, axis=1)
+        span_rows, span_starts = np.nonzero(span_edges == 1)
+        _, span_ends = np.nonzero(span_edges == -1)
+
+        spans += zip((span_rows + a).tolist(), (span_starts + self._c0).tolist(), (span_ends + self._c0).tolist())
+        return
+
+    def _scanline(self, limit: int, spans: List[Tuple[int, int, int]]):
+        """
+            Scanline fill from the seeds, until about limit cells have been looked at. Run
+            ends are found with byte searches over the buffers and only one seed id per run
+            is ever pushed.
+        """
+        board = self._board
+        revealed = board._revealed_buf
+        flagged = board._flagged_buf
+        zero = board._zero_mask
+
+        cols = board.num_columns
+        num_cells = board.num_cells
+
+        ones = memoryview(b"\x01" * (cols + 2))
+        seeds = self._seeds
+
+        while seeds and limit > 0:
+            i = seeds.pop()
+
+            # Already filled by the run of another seed in the same stretch
+            if revealed[i]:
+                limit -= 1
+                continue
+
+            r = i // cols
+            row = r * cols
+            row_end = row + cols
+
+            # Grow the run of unopened zero cells both ways
+            end = _find(zero, 0, i, row_end)
+            end = _find(revealed, 1, i, end)
+            end = _find(flagged, 1, i, end)
+
+            start = _rfind(zero, 0, row, i)
+            start = _rfind(revealed, 1, start, i)
+            start = _rfind(flagged, 1, start, i)
+
+            # The cells just past either end of the run can only be numbered border cells
+            lo = start - 1 if start > row and not (revealed[start - 1] or flagged[start - 1]) else start
+            hi = end + 1 if end < row_end and not (revealed[end] or flagged[end]) else end
+
+            revealed[lo:hi] = ones[:hi - lo]
+            spans.append((r, lo - row, hi - row))
+
+            # Every cell in [start - 1, end + 1) of the rows above and below touches the run
+            a = start - 1 - row if start > row else start - row
+            b = end + 1 - row if end < row_end else end - row
+            limit -= 3 * (b - a)
+
+            for nrow in (row - cols, row + cols):
+                if nrow < 0 or nrow >= num_cells:
+                    continue
+
+                j = nrow + a
+                stop = nrow + b
+                while j < stop:
+                    if revealed[j]:
+                        j = _find(revealed, 0, j, stop)
+                        continue
+                    if flagged[j]:
+                        j += 1
+                        continue
+
+                    k = j
+                    if zero[j]:
+                        # One seed for the whole stretch of unopened zero cells
+                        seeds.append(j)
+                        j += 1
+                        while j < stop and zero[j] and not (revealed[j] or flagged[j]):
+                            j += 1
+                    else:
+                        j += 1
+                        while j < stop and not (zero[j] or revealed[j] or flagged[j]):
+                            j += 1
+                        revealed[k:j] = ones[:j - k]
+                        spans.append((r + (1 if nrow > row else -1), k - nrow, j - nrow))
+        return
+
+
+class Board:
+    """
+        Compact storage for the state of every cell on the grid.
+
+        Each piece of cell state lives in its own flat buffer indexed by cell id,
+        where cell_id = r * num_columns + c:
+
+            mines    -> True if the cell holds a mine
+            adjacent -> Number of adjacent mines (MINE_ADJACENT_VALUE for mines)
+            revealed -> True once the cell has been revealed
+            flagged  -> True while the cell carries a flag
+
+        The buffers are bytearrays exposed as numpy arrays sharing the same memory.
+        Vectorized code goes through the arrays, while the flood fills index and search
+        the bytearrays directly, which is much faster from python code. Always write
+        into the arrays in place, never rebind them.
+    """
+
+    def __init__(self, num_rows: int, num_columns: int):
+
+        self.num_rows: int = num_rows
+        self.num_columns: int = num_columns
+        self.num_cells: int = num_rows * num_columns
+
+        self._mines_buf: bytearray = bytearray(self.num_cells)
+        self._adjacent_buf: bytearray = bytearray(self.num_cells)
+        self._revealed_buf: bytearray = bytearray(self.num_cells)
+        self._flagged_buf: bytearray = bytearray(self.num_cells)
+
+        self.mines: np.ndarray = np.frombuffer(self._mines_buf, dtype=np.bool_)
+        self.adjacent: np.ndarray = np.frombuffer(self._adjacent_buf, dtype=np.uint8)
+        self.revealed: np.ndarray = np.frombuffer(self._revealed_buf, dtype=np.bool_)
+        self.flagged: np.ndarray = np.frombuffer(self._flagged_buf, dtype=np.bool_)
+
+        # 1 for every safe cell with no adjacent mines. Rebuilt whenever counts change
+        self._zero_mask: bytes = b"\x01" * self.num_cells
+
+        # Openings of the board, built on the first span reveal after counts change
+        self._zero_runs: Optional[ZeroRuns] = None
+
+        self.cell_neighbors: List[Tuple[int, int]] = [v.value for v in list(cell_neighbor_increments)]
+
+        return
+
+    def place_mines(self, mine_ids: Iterable[int]):
+        self.mines[:] = False
+        self.mines[np.asarray(mine_ids, dtype=np.intp)] = True
+        self.adjacent[:] = 0
+        self.adjacent[self.mines] = MINE_ADJACENT_VALUE
+        self._zero_mask = (self.adjacent == 0).tobytes()
+        self._zero_runs = None
+        return
+
+    def compute_adjacent_mine_counts(self):
+        """
+            Builds the whole adjacent count field in one pass.
+
+            The mine mask is padded by one cell on every side, so each of the 8 neighbor
+            offsets becomes a shifted slice of the padded mask. Summing the slices gives
+            the count for every cell at once, with no bounds checks on the edges.
+        """
+        rows = self.num_rows
+        cols = self.num_columns
+
+        padded = np.zeros((rows + 2, cols + 2), dtype=np.uint8)
+        padded[1:-1, 1:-1] = self.mines.reshape(rows, cols)
+
+        counts = self.adjacent.reshape(rows, cols)
+        counts[:] = 0
+        for dr, dc in self.cell_neighbors:
+            counts += padded[1 + dr:1 + dr + rows, 1 + dc:1 + dc + cols]
+
+        self.adjacent[self.mines] = MINE_ADJACENT_VALUE
+        self._zero_mask = (self.adjacent == 0).tobytes()
+        self._zero_runs = None
+        return
+
+    def compute_3bv(self) -> int:
+        """
+            Fewest clicks that clear the board: one per opening, plus one per safe numbered
+            cell that no opening reveals. Needs the adjacent counts.
+        """
+        rows = self.num_rows
+        cols = self.num_columns
+        zero = np.frombuffer(self._zero_mask, dtype=np.bool_).reshape(rows, cols)
+        num_openings = len(self.zero_runs().offsets) - 1
+
+        # Cells next to a zero open with its opening. 3x3 dilation of the zero cells
+        near_zero = zero.copy()
+        near_zero[1:] |= zero[:-1]
+        near_zero[:-1] |= zero[1:]
+        grown = near_zero.copy()
+        near_zero[:, 1:] |= grown[:, :-1]
+        near_zero[:, :-1] |= grown[:, 1:]
+
+        isolated = ~near_zero & ~self.mines.reshape(rows, cols)
+        return num_openings + int(np.count_nonzero(isolated))
+
+    def flood_reveal(self, cell_id: int) -> List[int]:
+        """
+            Reveals cell_id and, if it has no adjacent mines, the whole opening connected to it.
+
+            The revealed mask doubles as the visited set, so nothing is allocated per call.
+            Neighbors that are out of bounds, already revealed or flagged are never pushed,
+            which keeps the cost proportional to the number of cells opened.
+
+            :return: Ids of the newly revealed cells, in reveal order
+        """
+        return PendingReveal(self, cell_id).step()
+
+    # Openings with fewer zero cells than this are flood filled cell by cell in span mode
+    SPAN_VECTOR_CUTOFF: int = 256
+
+    def zero_runs(self) -> ZeroRuns:
+        """
+            Openings of the board, built on first use after the counts change.
+        """
+        if self._zero_runs is None:
+            zero = np.frombuffer(self._zero_mask, dtype=np.bool_).reshape(self.num_rows, self.num_columns)
+            self._zero_runs = ZeroRuns(zero)
+        return self._zero_runs
+
+    def flood_reveal_spans(self, cell_id: int) -> List[Tuple[int, int, int]]:
+        """
+            Reveal mode for large openings that works on whole horizontal runs of cells
+            and reports results as row spans instead of one id per cell.
+
+            Large openings are revealed from the precomputed ZeroRuns, or with a scanline
+            fill when flags have already cut them up. Small openings are cheaper to flood
+            fill cell by cell and are only converted to spans. All in one go, see
+            PendingSpanReveal to spread the work out.
+
+            :return: Disjoint (row, start column, end column) spans of newly revealed
+                     cells, end column exclusive
+        """
+        return PendingSpanReveal(self, cell_id).step()
+
+    def _ids_to_spans(self, cell_ids: List[int]) -> List[Tuple[int, int, int]]:
+        spans: List[Tuple[int, int, int]] = []
+        cols = self.num_columns
+        start = end = -1
+        for cell_id in sorted(cell_ids):
+            if cell_id == end and cell_id % cols:
+                end += 1
+                continue
+            if start >= 0:
+                spans.append((start // cols, start % cols, start % cols + end - start))
+            start = cell_id
+            end = cell_id + 1
+        if start >= 0:
+            spans.append((start // cols, start % cols, start % cols + end - start))
+        return spans
+
+    def reset(self):
+        self.mines[:] = False
+        self.adjacent[:] = 0
+        self.revealed[:] = False
+        self.flagged[:] = False
+        self._zero_mask = b"\x01" * self.num_cells
+        self._zero_runs = None
+        return
+
+    # Utilities
+    def id_to_grid_coords(self, cell_id: int) -> Tuple[int, int]:
+        return cell_id // self.num_columns, cell_id % self.num_columns
+
+    def grid_coords_to_id(self, r: int, c: int) -> int:
+        return r * self.num_columns + c
+
+    def in_bounds(self, r: int, c: int) -> bool:
+        return 0 <= r < self.num_rows and 0 <= c < self.num_columns
+
+    def neighbor_ids(self, cell_id: int) -> List[int]:
+        r, c = self.id_to_grid_coords(cell_id)
+        ret = []
+        for dr, dc in self.cell_neighbors:
+            nr = r + dr
+            nc = c + dc
+            if self.in_bounds(nr, nc):
+                ret.append(nr * self.num_columns + nc)
+        return ret
+
+    @property
+    def nbytes(self) -> int:
+        return self.mines.nbytes + self.adjacent.nbytes + self.revealed.nbytes + self.flagged.nbytes
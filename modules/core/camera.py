@@ -0,0 +1,146 @@
+from typing import Optional, Tuple
+
+
+class Camera():
+    """
+        Maps screen pixels to board cells and back. Needs no display.
+
+        The board is laid out in world pixels, cell (r, c) at (c * cell_width, r * cell_height)
+        divided by cells_per_pixel. The camera shows the screen_size area of it whose top
+        left corner is (x, y). Zooming changes the cell size, panning moves (x, y).
+
+        Zooming out past min_cell_size packs more than one cell into a pixel instead.
+        Hit-testing can only tell the cells of a pixel apart at one cell per pixel or less.
+    """
+
+    # Zoom steps multiply the cell size by this much
+    ZOOM_STEP: float = 1.25
+
+    def __init__(self, cell_size: Tuple[int, int], screen_size: Tuple[int, int],
+                 min_cell_size: int = 1, max_cell_size: int = 128, max_cells_per_pixel: int = 1024):
+
+        self.cell_width: int = cell_size[0]
+        self.cell_height: int = cell_size[1]
+        self.screen_size: Tuple[int, int] = screen_size
+
+        self.min_cell_size: int = min_cell_size
+        self.max_cell_size: int = max_cell_size
+
+        # Only above 1 once both cell sizes are at min_cell_size
+        self.cells_per_pixel: int = 1
+        self.max_cells_per_pixel: int = max_cells_per_pixel
+
+        # World pixel at the top left of the screen
+        self.x: int = 0
+        self.y: int = 0
+
+        # Screen position the current pan started from, None when not panning
+        self._pan_anchor: Optional[Tuple[int, int]] = None
+
+        return
+
+    @property
+    def cell_size(self) -> Tuple[int, int]:
+        return self.cell_width, self.cell_height
+
+    @property
+    def view(self) -> Tuple[int, int, int, int, int]:
+        """
+            Everything that decides what is on screen. Renderers compare it between frames.
+        """
+        return self.x, self.y, self.cell_width, self.cell_height, self.cells_per_pixel
+
+    @property
+    def panning(self) -> bool:
+        return self._pan_anchor is not None
+
+    # Transforms
+    def screen_to_cell(self, x: int, y: int) -> Tuple[int, int]:
+        """
+            :return: (row, column) of the cell under screen pixel (x, y). May be off the board
+        """
+        k = self.cells_per_pixel
+        return (y + self.y) * k // self.cell_height, (x + self.x) * k // self.cell_width
+
+    def cell_to_screen(self, r: int, c: int) -> Tuple[int, int]:
+        """
+            :return: Screen position of the top left corner of cell (r, c)
+        """
+        k = self.cells_per_pixel
+        return c * self.cell_width // k - self.x, r * self.cell_height // k - self.y
+
+    def visible_cells(self, num_rows: int, num_columns: int) -> Tuple[int, int, int, int]:
+        """
+            Cells at least partly on screen, clipped to the board.
+
+            :return: (first row, end row, first column, end column). Ends are exclusive,
+                     and equal to the start when nothing is visible
+        """
+        r0, c0 = self.screen_to_cell(0, 0)
+        r1, c1 = self.screen_to_cell(self.screen_size[0] - 1, self.screen_size[1] - 1)
+        r0 = min(max(r0, 0), num_rows)
+        c0 = min(max(c0, 0), num_columns)
+        return r0, max(r0, min(r1 + 1, num_rows)), c0, max(c0, min(c1 + 1, num_columns))
+
+    # Movement
+    def pan(self, dx: int, dy: int):
+        """
+            Moves the view by (dx, dy) screen pixels. The board follows the pointer, so
+            dragging right shows more of the left side.
+        """
+        self.x -= dx
+        self.y -= dy
+        return
+
+    def begin_pan(self, pos: Tuple[int, int]):
+        self._pan_anchor = pos
+        return
+
+    def pan_to(self, pos: Tuple[int, int]):
+        """
+            Pans by how far pos is from where the pan was last at.
+        """
+        if self._pan_anchor is None:
+            return
+        self.pan(pos[0] - self._pan_anchor[0], pos[1] - self._pan_anchor[1])
+        self._pan_anchor = pos
+        return
+
+    def end_pan(self):
+        self._pan_anchor = None
+        return
+
+    def zoom(self, steps: int, pos: Tuple[int, int]):
+        """
+            Zooms in by steps ZOOM_STEPs, out if negative, keeping the point under screen
+            position pos in place. Every step changes the cell size by at least a pixel,
+            or cells_per_pixel by at least one.
+        """
+        for _ in range(0, abs(steps)):
+            self._zoom_step(steps > 0, pos)
+        return
+
+    def _zoom_step(self, zoom_in: bool, pos: Tuple[int, int]):
+        w, h, k = self.cell_width, self.cell_height, self.cells_per_pixel
+        nw, nh, nk = w, h, k
+        if zoom_in and k > 1:
+            nk = max(1, min(k - 1, round(k / self.ZOOM_STEP)))
+        elif zoom_in:
+            nw = min(max(w + 1, round(w * self.ZOOM_STEP)), self.max_cell_size)
+            nh = min(max(h + 1, round(h * self.ZOOM_STEP)), self.max_cell_size)
+        elif w > self.min_cell_size or h > self.min_cell_size:
+            nw = max(min(w - 1, round(w / self.ZOOM_STEP)), self.min_cell_size)
+            nh = max(min(h - 1, round(h / self.ZOOM_STEP)), self.min_cell_size)
+        else:
+            nk = min(max(k + 1, round(k * self.ZOOM_STEP)), self.max_cells_per_pixel)
+
+        if (nw, nh, nk) == (w, h, k):
+            return
+
+        # Same world point, in cells, under pos before and after
+        self.x = round((pos[0] + self.x) * nw * k / (w * nk)) - pos[0]
+        self.y = round((pos[1] + self.y) * nh * k / (h * nk)) - pos[1]
+        self.cell_width = nw
+        self.cell_height = nh
+        self.cells_per_pixel = nk
+        return
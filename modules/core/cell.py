@@ -0,0 +1,160 @@
+from .enums import RevealColors
+from .board import Board
+
+
+from enum import Enum
+
+from typing import Tuple, Union
+
+
+class CellType(Enum):
+    EMPTY = 0
+    BOMB = 1
+    CELL = 3
+
+class CellState(Enum):
+    ACTIVE = True
+    INACTIVE = False
+
+
+# Thin view over a single cell of a Board. Holds no state of its own,
+# every property reads / writes the board buffers directly.
+class Cell():
+
+    REVEAL_COLOR_LOOKUP_TABLE = list(RevealColors)
+
+    __slots__ = ("_board", "id", "grid_r", "grid_c")
+
+    def __init__(self, board: Board, cell_num: int):
+
+        self._board: Board = board
+        self.id: int = cell_num
+        self.grid_r: int = cell_num // board.num_columns
+        self.grid_c: int = cell_num % board.num_columns
+
+        return
+
+    @property
+    def adjacent_mine_count(self) -> int:
+        return int(self._board.adjacent[self.id])
+
+    @property
+    def flag(self) -> bool:
+        return bool(self._board.flagged[self.id])
+
+    @flag.setter
+    def flag(self, flag: bool) -> None:
+        try:
+            assert isinstance(flag, bool)
+
+        except AssertionError as e:
+            print("ERROR: Flag is not a bool!")
+
+        self._board.flagged[self.id] = flag
+
+    @property
+    def revealed(self) -> bool:
+        return bool(self._board.revealed[self.id])
+
+    @revealed.setter
+    def revealed(self, r: bool):
+        assert isinstance(r, bool)
+        self._board.revealed[self.id] = r
+        return
+
+    @property
+    def reveal_color(self) -> RevealColors:
+        return Cell.REVEAL_COLOR_LOOKUP_TABLE[self._board.adjacent[self.id]]
+
+    def flag_cell(self):
+        self.flag = True
+
+    def unflag_cell(self):
+        self.flag = False
+
+    def reveal_cell(self):
+        self.revealed = True
+        return True
+
+    def get_cell_type(self):
+        return CellType.CELL
+
+    def get_grid_coords(self):
+        return (self.grid_r, self.grid_c)
+
+
+class EmptyCell(Cell):
+
+    __slots__ = ()
+
+    def increment_adjacent_mine_count(self) -> int:
+        count = self._board.adjacent[self.id] + 1
+        if count > 8:
+            print("Error. Neighbors can not be > 8!")
+            exit(0)
+
+        self._board.adjacent[self.id] = count
+        return int(count)
+
+    def get_cell_type(self):
+        return CellType.EMPTY
+
+class MineCell(Cell):
+
+    __slots__ = ()
+
+    def increment_adjacent_mine_count(self) -> int:
+        # Don't do anything for Mines.
+        return self.adjacent_mine_count
+
+    def get_cell_type(self):
+        return CellType.BOMB
+
+
+def make_cell(board: Board, cell_num: int) -> Union[MineCell, EmptyCell]:
+    if board.mines[cell_num]:
+        return MineCell(board, cell_num)
+    return EmptyCell(board, cell_num)
+
+
+class _BoardRowView():
+
+    __slots__ = ("_board", "_r")
+
+    def __init__(self, board: Board, r: int):
+        self._board: Board = board
+        self._r: int = r
+        return
+
+    def __len__(self) -> int:
+        return self._board.num_columns
+
+    def __getitem__(self, c: int) -> Union[MineCell, EmptyCell]:
+        if not 0 <= c < self._board.num_columns:
+            raise IndexError("column index out of range")
+        return make_cell(self._board, self._r * self._board.num_columns + c)
+
+
+class BoardView():
+    """
+        Keeps the old board[r][c] style access working on top of a Board.
+
+        Cells are created on demand and only live as long as the caller holds them.
+    """
+
+    __slots__ = ("_board",)
+
+    def __init__(self, board: Board):
+        self._board: Board = board
+        return
+
+    def __len__(self) -> int:
+        return self._board.num_rows
+
+    def __getitem__(self, r: int) -> _BoardRowView:
+        if not 0 <= r < self._board.num_rows:
+            raise IndexError("row index out of range")
+        return _BoardRowView(self._board, r)
+
+    def cell_from_id(self, cell_id: int) -> Union[MineCell, EmptyCell]:
+        return make_cell(self._board, cell_id)
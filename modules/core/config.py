@@ -0,0 +1,54 @@
+from ..settings import Settings
+from .camera import Camera
+import random
+import numpy as np
+from typing import Optional, Tuple
+
+
+class Config():
+    def __init__(self, settings: Settings, screen_size: Optional[Tuple[int, int]] = None):
+        """
+            Game configuration derived from Settings. Needs no display.
+
+            :param screen_size: Size of the surface the board is drawn on, if there is one.
+                                Defaults to the window size in settings. Only used to work
+                                out cell sizes that settings leave unset.
+        """
+        if screen_size is None:
+            screen_size = (settings.grid_width, settings.grid_height)
+        
+        # Cells are never smaller than a pixel, even on boards larger than the screen
+        self.cell_width: int = 0
+        if settings.cell_width == None:
+            self.cell_width = max(1, int(screen_size[0] / settings.num_columns))
+        else:
+            self.cell_width = settings.cell_width
+
+        self.cell_height: int = 0
+        if settings.cell_height == None:
+            self.cell_height = max(1, int(screen_size[1] / settings.num_rows))
+        else:
+            self.cell_height = settings.cell_height
+
+        self.num_rows: int = settings.num_rows
+        self.num_columns: int = settings.num_columns
+        self.num_cells = self.num_rows * self.num_columns
+
+        self.off_set_x: int = 0
+        self.off_set_y: int = 0
+
+        # Zoom and pan. Starts at the cell size above, showing the top left of the board
+        self.camera: Camera = Camera((self.cell_width, self.cell_height), screen_size)
+
+        self.num_mines = settings.num_mines
+
+        # Reveal openings as row spans instead of cell by cell
+        self.span_reveal: bool = settings.span_reveal
+
+        random.seed(settings.seed)
+        self.rng: np.random.Generator = np.random.default_rng(settings.seed)
+
+        from .enums import cell_neighbor_increments
+        self.cell_neighbors = [v.value for v in list(cell_neighbor_increments)]
+
+        return
@@ -54,4 +54,20 @@ class CellRevealed(Enum):
         Use to set and determine if a cell has been revealed
     """
     REVEALED = True
-    NO_REVEAL = False
\ No newline at end of file
+    NO_REVEAL = False
+
+class CellDisplayState(Enum):
+    """
+        What a cell currently looks like on screen
+    """
+    HIDDEN   = auto()
+    FLAGGED  = auto()
+    REVEALED = auto()
+
+class GameState(Enum):
+    """
+        Where a game is at. Only PLAYING accepts reveals and flags
+    """
+    PLAYING = auto()
+    WON     = auto()
+    LOST    = auto()
@@ -0,0 +1,107 @@
+from ..settings import Settings
+from ..event_handler.eventAction import Action
+from ..event_handler.eventEnums import ActionType
+from typing import List, Optional
+import numpy as np
+
+from .grid import Grid
+from .logic import Logic
+from .config import Config
+from .observer import BoardObserver
+from . import trace
+from .stats import GameStats
+from .generator import BoardParams, BoardPool, generate_no_guess
+
+
+class CoreGame():
+    """
+        Everything needed to play a game, without pygame or a display.
+
+        Holds the grid and the game logic. Anything that wants to follow the board,
+        like a renderer, registers as an observer.
+    """
+
+    def __init__(self, settings: Optional[Settings] = None, config: Optional[Config] = None,
+                 mine_ids: Optional[np.ndarray] = None, board_pool: Optional[BoardPool] = None):
+        """
+            :param board_pool: Where no-guess boards come from. Without one they are
+                               generated here, on a process pool of their own
+        """
+
+        self.settings: Settings = settings if settings is not None else Settings()
+        self.config: Config = config if config is not None else Config(self.settings)
+        self._board_pool: Optional[BoardPool] = board_pool
+
+        # No-guess boards are only solvable from the start cell, so the game opens it
+        if self.settings.no_guess and mine_ids is None:
+            mine_ids = self._no_guess_board(self.settings.seed)
+
+        self.grid: Grid = Grid(self.config, mine_ids)
+        self.logic: Logic = Logic(self.grid, self.config)
+
+        if self.settings.no_guess:
+            self.open_start_cell()
+        return
+
+    def _no_guess_board(self, seed: Optional[int]) -> Optional[np.ndarray]:
+        """
+            Mines of a no-guess board, or None if none was found within no_guess_timeout.
+            With a pool, waits for its next board instead of generating alongside it.
+        """
+        if self._board_pool is not None:
+            return self._board_pool.get(timeout=self.settings.no_guess_timeout)
+        return generate_no_guess(BoardParams.from_settings(self.settings), seed=seed,
+                                 timeout=self.settings.no_guess_timeout).mine_ids
+
+    def open_start_cell(self):
+        """
+            Reveals the no-guess start cell. If generation timed out no mines are placed
+            yet, so this is an ordinary safe first click instead.
+        """
+        cells = self.grid.cells
+        start_id = BoardParams.from_settings(self.settings).start_id
+        if not self.grid.mines_placed or (cells.adjacent[start_id] == 0 and not cells.mines[start_id]):
+            # By id, the camera may be zoomed out past one cell per pixel
+            self.logic.reveal_cell_id(start_id)
+        return
+
+    @property
+    def stats(self) -> GameStats:
+        return self.logic.stats
+
+    def restart(self, mine_ids: Optional[np.ndarray] = None):
+        """
+            New game in place. The board buffers, the observers and anything else
+            following this game are kept, only the cell state is cleared.
+
+            :param mine_ids: Mines of the next board, e.g. one generated in the background.
+                             If None, mines wait for the first click as usual, or a no-guess
+                             board is generated here
+        """
+        if self.settings.no_guess and mine_ids is None:
+            # From the game's rng, so a seeded game restarts to the same boards every time
+            mine_ids = self._no_guess_board(int(self.config.rng.integers(2 ** 63)))
+
+        with trace.span("restart"):
+            self.grid.reset(mine_ids)
+            self.logic.reset()
+
+        if self.settings.no_guess:
+            self.open_start_cell()
+        return
+
+    def add_observer(self, o: BoardObserver):
+        self.logic.add_observer(o)
+        return
+
+    def apply_action(self, a: Action):
+        if a.action == ActionType.RESTART:
+            self.restart()
+            return
+        self.logic.update_board(a)
+        return
+
+    def apply_actions(self, batch: List[Action]):
+        for a in batch:
+            self.apply_action(a)
+        return
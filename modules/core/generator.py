@@ -0,0 +1,303 @@
+import multiprocessing as mp
+import os
+import queue
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from ..settings import Settings
+from ..event_handler.eventEnums import ActionType
+
+
+@dataclass(frozen=True)
+class BoardParams:
+    num_rows: int
+    num_columns: int
+    num_mines: int
+
+    @property
+    def num_cells(self) -> int:
+        return self.num_rows * self.num_columns
+
+    @property
+    def start_id(self) -> int:
+        """
+            Cell the game opens for the player. Always a zero, so the first reveal is an opening.
+        """
+        return (self.num_rows // 2) * self.num_columns + self.num_columns // 2
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "BoardParams":
+        return cls(settings.num_rows, settings.num_columns, settings.num_mines)
+
+
+@dataclass
+class GenerationReport:
+    mine_ids: Optional[np.ndarray]
+    # Index of the candidate that passed. Candidate i is the same board for a given seed
+    attempt: Optional[int]
+    attempts: int = 0
+    seconds: float = 0.0
+    # Time each candidate took to generate and verify
+    attempt_seconds: List[float] = field(default_factory=list)
+
+    @property
+    def found(self) -> bool:
+        return self.mine_ids is not None
+
+
+def candidate_mine_ids(params: BoardParams, seed: int, attempt: int) -> np.ndarray:
+    """
+        Random mines, keeping the start cell and its neighbors clear.
+    """
+    r, c = divmod(params.start_id, params.num_columns)
+    keep_clear = [
+        nr * params.num_columns + nc
+        for nr in range(r - 1, r + 2)
+        for nc in range(c - 1, c + 2)
+        if 0 <= nr < params.num_rows and 0 <= nc < params.num_columns
+    ]
+    allowed = np.setdiff1d(np.arange(params.num_cells), keep_clear)
+    rng = np.random.default_rng([seed, attempt])
+    return np.sort(rng.choice(allowed, params.num_mines, replace=False))
+
+
+def is_no_guess(params: BoardParams, mine_ids: np.ndarray) -> bool:
+    """
+        Plays the board from the start cell without ever guessing.
+
+        The constraint solver does almost all of the work. Only when it is stuck is the
+        exact probability engine asked, since it also uses the total mine count. Any
+        cell it proves safe or a mine is still a forced move.
+    """
+    from .game import CoreGame
+    from .probability import ProbabilityEngine
+    from .solver import Solver
+
+    settings = Settings(num_rows=params.num_rows, num_columns=params.num_columns, num_mines=params.num_mines)
+    game = CoreGame(settings, mine_ids=mine_ids)
+    board = game.grid.cells
+    logic = game.logic
+
+    game.apply_action(logic.cell_action(ActionType.REVEAL, *board.id_to_grid_coords(params.start_id)))
+    solver = Solver(game)
+    engine = ProbabilityEngine(game)
+
+    while True:
+        solver.run()
+        if game.stats.won:
+            return True
+
+        probs = engine.compute()
+        actions = [logic.cell_action(ActionType.REVEAL, *board.id_to_grid_coords(i)) for i in probs.safe]
+        actions += [logic.cell_action(ActionType.FLAG, *board.id_to_grid_coords(i)) for i in probs.mines]
+
+        if not actions:
+            return False
+        game.apply_actions(actions)
+
+
+# Lowest passing attempt found so far, shared by every worker. Attempts above it are skipped
+_best_attempt = None
+
+_NO_ATTEMPT = 2 ** 62
+
+
+def _init_worker(best_attempt):
+    global _best_attempt
+    _best_attempt = best_attempt
+    return
+
+
+def _try_attempts(params: BoardParams, seed: int, first: int, count: int) -> Tuple[Optional[int], List[float]]:
+    times: List[float] = []
+    for attempt in range(first, first + count):
+        if _best_attempt.value < attempt:
+            break
+
+        start = time.perf_counter()
+        passed = is_no_guess(params, candidate_mine_ids(params, seed, attempt))
+        times.append(time.perf_counter() - start)
+
+        if passed:
+            with _best_attempt.get_lock():
+                _best_attempt.value = min(_best_attempt.value, attempt)
+            return attempt, times
+    return None, times
+
+
+def make_executor(workers: Optional[int] = None) -> Tuple[ProcessPoolExecutor, "mp.Value"]:
+    best_attempt = mp.Value("q", _NO_ATTEMPT)
+    executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(best_attempt,))
+    return executor, best_attempt
+
+
+def generate_no_guess(params: BoardParams, seed: Optional[int] = None, timeout: float = 10.0,
+                      max_attempts: int = 100000, workers: Optional[int] = None,
+                      attempts_per_task: int = 4, executor=None) -> GenerationReport:
+    """
+        Rejection sampling for a board that can be solved from the start cell without guessing.
+
+        Candidates are generated and verified in parallel. Once one passes, every attempt
+        after it is cancelled. Attempts before it still finish, and the lowest passing
+        attempt wins, so a seed always gives the same board whatever the worker count.
+
+        :param timeout: Give up after this many seconds. The report then has no mine_ids
+        :param executor: (executor, shared value) from make_executor(), reused between calls
+    """
+    if seed is None:
+        seed = int(np.random.SeedSequence().generate_state(1)[0])
+
+    own_executor = executor is None
+    pool, best_attempt = make_executor(workers) if own_executor else executor
+    best_attempt.value = _NO_ATTEMPT
+
+    report = GenerationReport(mine_ids=None, attempt=None)
+    start = time.perf_counter()
+    deadline = start + timeout
+    in_flight: Dict[Future, int] = {}
+    next_attempt = 0
+    max_in_flight = 2 * (workers or os.cpu_count() or 1)
+
+    try:
+        while True:
+            best = best_attempt.value
+            while len(in_flight) < max_in_flight and next_attempt < min(best, max_attempts):
+                count = min(attempts_per_task, max_attempts - next_attempt)
+                in_flight[pool.submit(_try_attempts, params, seed, next_attempt, count)] = next_attempt
+                next_attempt += count
+
+            # Done once nothing below the best attempt is still running
+            if not any(first < best for first in in_flight.values()):
+                break
+
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+
+            done, _ = wait(in_flight, timeout=remaining, return_when=FIRST_COMPLETED)
+            for future in done:
+                del in_flight[future]
+                _, times = future.result()
+                report.attempts += len(times)
+                report.attempt_seconds += times
+
+        # Negative means close() stopped us
+        if 0 <= best_attempt.value < _NO_ATTEMPT:
+            report.attempt = best_attempt.value
+            report.mine_ids = candidate_mine_ids(params, seed, report.attempt)
+
+    finally:
+        # Stop whatever is left, passed or timed out. Running tasks stop after their
+        # current attempt, and are waited for so none of them touches the next generation
+        best_attempt.value = -1
+        for future in in_flight:
+            future.cancel()
+        wait(in_flight)
+        if own_executor:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    report.seconds = time.perf_counter() - start
+    return report
+
+
+class BoardPool():
+    """
+        Keeps no-guess boards ready so starting a game does not wait on generation.
+
+        A background thread tops the pool up through a process pool. Boards left over
+        when the pool is closed are saved to path and loaded again next time, so even
+        the first game of a session usually starts straight away. Without a path the
+        pool starts empty, and the first get() waits for the first board.
+
+        Pool board k comes from seed (seed, k), so a seeded session gets the same boards.
+    """
+
+    def __init__(self, params: BoardParams, size: int = 4, seed: Optional[int] = None,
+                 path: Optional[str] = None, workers: Optional[int] = None, timeout: float = 10.0):
+
+        self.params: BoardParams = params
+        self._seed: int = seed if seed is not None else int(np.random.SeedSequence().generate_state(1)[0])
+        self._path: Optional[str] = path
+        self._timeout: float = timeout
+        self._boards: "queue.Queue[np.ndarray]" = queue.Queue(maxsize=size)
+
+        # Every finished generation, for latency reporting
+        self.reports: List[GenerationReport] = []
+
+        self._load()
+
+        self._executor = make_executor(workers)
+        self._closed = threading.Event()
+        self._thread = threading.Thread(target=self._fill, name="board-pool", daemon=True)
+        self._thread.start()
+        return
+
+    def __len__(self) -> int:
+        return self._boards.qsize()
+
+    def get(self, timeout: Optional[float] = None) -> Optional[np.ndarray]:
+        """
+            :return: Mine ids of a no-guess board, or None if none is ready within timeout
+        """
+        try:
+            return self._boards.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def _fill(self):
+        k = 0
+        while not self._closed.is_set():
+            seed = int(np.random.SeedSequence([self._seed, k]).generate_state(1)[0])
+            report = generate_no_guess(self.params, seed=seed, timeout=self._timeout,
+                                       executor=self._executor)
+            k += 1
+            if self._closed.is_set():
+                break
+            self.reports.append(report)
+            if report.found:
+                # Blocks while the pool is full
+                while not self._closed.is_set():
+                    try:
+                        self._boards.put(report.mine_ids, timeout=0.1)
+                        break
+                    except queue.Full:
+                        continue
+        return
+
+    def close(self):
+        self._closed.set()
+        # Stops the generation that is running, if any. Repeated in case one was just starting
+        while self._thread.is_alive():
+            self._executor[1].value = -1
+            self._thread.join(timeout=0.05)
+        self._executor[0].shutdown(wait=True, cancel_futures=True)
+        self._save()
+        return
+
+    def _load(self):
+        if self._path is None or not os.path.exists(self._path):
+            return
+        with np.load(self._path) as saved:
+            if tuple(saved["params"]) != (self.params.num_rows, self.params.num_columns, self.params.num_mines):
+                return
+            for mine_ids in saved["boards"]:
+                if self._boards.full():
+                    break
+                self._boards.put(mine_ids)
+        return
+
+    def _save(self):
+        if self._path is None:
+            return
+        boards = []
+        while not self._boards.empty():
+            boards.append(self._boards.get())
+        params = (self.params.num_rows, self.params.num_columns, self.params.num_mines)
+        np.savez(self._path, params=np.array(params),
+                 boards=np.array(boards, dtype=np.intp).reshape(len(boards), self.params.num_mines))
+        return
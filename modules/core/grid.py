@@ -0,0 +1,190 @@
+from .cell import Cell, CellType, CellState, MineCell, EmptyCell, BoardView, make_cell
+from .board import Board
+from typing import Tuple, List, Union, Optional
+import numpy as np
+import random
+import sys
+
+from ..settings import Settings
+from .enums import RevealColors, cell_neighbor_increments
+from .enums import CellFlagState, CellRevealed
+from .config import Config
+from . import trace
+from modules.event_handler.eventAction import Action
+
+
+class GridMetaData:
+    def __init__(self, config: Config):
+        
+        self._config: Config = config
+
+        self.num_flags:int  = 0
+
+        # Contains the ids of the cells that contain mines
+        # Filled in by Grid._init_mines()
+        self.mine_ids: np.ndarray = np.empty(0, dtype=np.intp)
+
+        self.cell_neighbors = [v.value for v in list(cell_neighbor_increments)]
+        
+        return
+
+    def generate_mine_ids(self, keep_clear: Optional[List[int]] = None):
+        """
+            :param keep_clear: Cells that must not get a mine, the first click then its
+                               neighbors. Without room for every mine elsewhere, only the
+                               first click is kept clear, and with no room even for that,
+                               nothing is
+        """
+        num_cells = self._config.num_cells
+        num_mines = self._config.num_mines
+
+        if keep_clear and num_cells - len(keep_clear) < num_mines:
+            keep_clear = keep_clear[:1]
+
+        if keep_clear and num_cells - len(keep_clear) >= num_mines:
+            # Same sorted ids as np.setdiff1d(np.arange(num_cells), keep_clear), without the sort
+            allowed = np.ones(num_cells, dtype=np.bool_)
+            allowed[keep_clear] = False
+            allowed = np.flatnonzero(allowed)
+            self.mine_ids = self._config.rng.choice(allowed, num_mines, replace=False)
+        else:
+            self.mine_ids = self._config.rng.choice(num_cells, num_mines, replace=False)
+        return
+
+
+
+class Grid:
+    """
+        Class that holds the grid information.
+
+        Cell state is kept in a flat, array backed Board (self.cells).
+        self.board is a view over it that keeps board[r][c] access working.
+
+    """
+    # todo
+    #   Fix parameter list!
+    def __init__(self, config: Config, mine_ids: Optional[np.ndarray] = None):
+        
+        self._config: Config = config
+        # Contains the grid metadata
+        self.metadata: GridMetaData = GridMetaData(config)
+
+        # Mines are placed on the first reveal, unless handed in
+        self.mines_placed: bool = False
+
+        # Array backed state of every cell
+        with trace.span("grid build", rows=config.num_rows, columns=config.num_columns):
+            self.cells: Board = self._init_grid(config, mine_ids)
+
+        # board[r][c] style view over self.cells
+        self.board: BoardView = BoardView(self.cells)
+        self._grid_init = True
+
+        return
+
+    # Utilities
+    def get_grid_coords_from_cell_num(self, cell_num: int)->Tuple[int, int]:
+        return self.cells.id_to_grid_coords(cell_num)
+    """
+
+        Below are functions used in __init__()
+    
+    """
+    def _init_grid(self, config: Config, mine_ids: Optional[np.ndarray] = None) -> Board:
+        
+        ret_grid = Board(self._config.num_rows, self._config.num_columns)
+        
+        self._init_mines(ret_grid, config, mine_ids)
+
+        return ret_grid
+    
+    def _init_mines(self, g: Board, config: Config, mine_ids: Optional[np.ndarray] = None):
+
+        # Mines can be handed in, e.g. a board from the no-guess generator.
+        # Otherwise they wait for the first click, see place_mines()
+        if mine_ids is not None:
+            self.metadata.mine_ids = np.asarray(mine_ids, dtype=np.intp)
+            g.place_mines(self.metadata.mine_ids)
+            self.mines_placed = True
+
+        return True
+
+    def place_mines(self, first_click_id: int):
+        """
+            Places the mines around the first revealed cell and computes the counts.
+
+            The clicked cell and its neighbors are kept clear, so the first click always
+            opens an area. On boards too full for that, only the clicked cell is, so the
+            first click is still safe. Mines come from config.rng, so a given seed and first
+            click always give the same board.
+        """
+        with trace.span("mine placement"):
+            keep_clear = [first_click_id] + self.cells.neighbor_ids(first_click_id)
+            self.metadata.generate_mine_ids(keep_clear)
+            self.cells.place_mines(self.metadata.mine_ids)
+        with trace.span("count pass"):
+            self.cells.compute_adjacent_mine_counts()
+        self.mines_placed = True
+        return
+
+    def reset(self, mine_ids: Optional[np.ndarray] = None):
+        """
+            Starts a new game on the same buffers, nothing is reallocated.
+
+            :param mine_ids: Mines of the new board. If None they are placed on the first reveal
+        """
+        self.cells.reset()
+        self.metadata.mine_ids = np.empty(0, dtype=np.intp)
+        self.metadata.num_flags = 0
+        self.mines_placed = False
+        self._init_mines(self.cells, self._config, mine_ids)
+        return
+
+    def _reveal_cells(self):
+        self.cells.revealed[:] = True
+        return
+    
+    def id_to_grid_coords(self, cell_id: int)-> Tuple[int, int]:
+        r = cell_id // self._config.num_columns
+        c = cell_id % self._config.num_columns
+        return r, c
+
+
+    def compute_offset(self)-> Tuple[int, int]:
+        
+        # Screen position of cell (0, 0), moves with the camera
+        return self._config.camera.cell_to_screen(0, 0)
+
+    def compute_cell_pos(self, r: int, c: int)-> Tuple[int, int]:
+        # x, y --> X pixeles left, y pixels down
+        return self._config.camera.cell_to_screen(r, c)
+
+    def get_cell_from_id(self, cell_id: int) -> Union[MineCell, EmptyCell]:
+        return make_cell(self.cells, cell_id)
+
+    @property
+    def cell_size(self)-> Tuple[int, int]:
+        # Current size on screen, after zoom
+        return self._config.camera.cell_size
+
+    def get_cell_from_coords(self, coords: Tuple[int, int]):
+        assert(coords != (-1, -1))
+        cell_num = self._get_cell_from_coords(coords)
+        return cell_num
+    
+    def _get_cell_from_coords(self, coords: Tuple[int, int])-> int:
+
+        """"
+            We want to get the cell number that the user clicked on based on the pixel coords
+
+            The camera undoes the pan and zoom, giving the row and column under the pixel.
+            Pixels off the board give -1.
+
+        """
+
+        r, c = self._config.camera.screen_to_cell(coords[0], coords[1])
+
+        cell_num = self.cells.grid_coords_to_id(r, c) if self.cells.in_bounds(r, c) else -1
+
+        return cell_num
+    
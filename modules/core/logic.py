@@ -0,0 +1,335 @@
+from .grid import Grid
+from .config import Config
+from .observer import BoardObserver
+from .board import PendingReveal, PendingSpanReveal
+from . import trace
+from .stats import GameStats
+from .enums import GameState
+from ..event_handler.eventAction import Action
+from ..event_handler.eventEnums import ActionType
+from dataclasses import dataclass
+from typing import Union, List, Optional, Tuple
+import numpy as np
+import time
+
+
+class Logic():
+    def __init__(self, grid: Grid, config: Config):
+        
+        # Told about every change to the board, e.g. the renderer
+        self._observers: List[BoardObserver] = []
+        self._grid: Grid = grid
+        self._config: Config = config
+        
+        self._curr_action: ActionType = None
+        self._curr_action_x: int = 0
+        self._curr_action_y: int = 0
+        self._curr_action_grid_row: int = 0
+        self._curr_action_grid_col: int = 0
+
+        # Seconds of reveal work per frame, see continue_reveal(). None reveals every
+        # cascade at once, which is what headless players rely on
+        self.reveal_budget: Optional[float] = None
+        # Cascade still being revealed
+        self._pending_reveal: Optional[Union[PendingReveal, PendingSpanReveal]] = None
+        # Cells opened by the last reveal so far, pending part included
+        self.cascade_size: int = 0
+
+        # Counters the game is decided from, see stats.py
+        self.stats: GameStats = GameStats(num_safe=grid.cells.num_cells - config.num_mines, num_mines=config.num_mines)
+
+        if self._grid.mines_placed:
+            self.determine_adjacent_mine_count()
+            self.stats.set_3bv_source(self._grid.cells.compute_3bv)
+
+    def add_observer(self, o: BoardObserver):
+        self._observers.append(o)
+        return
+
+    def remove_observer(self, o: BoardObserver):
+        self._observers.remove(o)
+        return
+
+    def _notify_cells_changed(self, cell_ids: List[int]):
+        for o in self._observers:
+            o.cells_changed(cell_ids)
+        return
+
+    def _notify_spans_changed(self, spans: List[Tuple[int, int, int]]):
+        for o in self._observers:
+            o.spans_changed(spans)
+        return
+
+    def reset(self):
+        """
+            Starts over after Grid.reset(). Observers stay registered and are told the
+            whole board changed.
+        """
+        self._pending_reveal = None
+        self.cascade_size = 0
+        self.stats = GameStats(num_safe=self._grid.cells.num_cells - self._config.num_mines,
+                               num_mines=self._config.num_mines)
+        if self._grid.mines_placed:
+            self.determine_adjacent_mine_count()
+            self.stats.set_3bv_source(self._grid.cells.compute_3bv)
+
+        for o in self._observers:
+            o.board_reset()
+        return
+
+    def _set_current_event(self, a: Action):
+        self._curr_action = a.action
+        self._curr_action_x: int = a.coords[0]
+        self._curr_action_y: int = a.coords[1]
+        r, c = self._get_cell_grid_coords()
+        self._curr_action_grid_row = r
+        self._curr_action_grid_col = c
+
+    def _get_cell_grid_coords(self):
+        return self._config.camera.screen_to_cell(self._curr_action_x, self._curr_action_y)
+
+    def cell_action(self, action: ActionType, r: int, c: int) -> Action:
+        """
+            Inverse of _get_cell_grid_coords. Builds an Action that update_board() will
+            apply to cell (r, c), for code that plays the game by cell rather than by mouse.
+            Needs the camera at one cell per pixel or less, as it is unless zoomed out.
+            Zoomed out further, a pixel covers several cells, use reveal_cell_id() instead.
+        """
+        camera = self._config.camera
+        if camera.cells_per_pixel > 1:
+            raise ValueError("cell_action needs one cell per pixel or less, the camera is zoomed out past it")
+        x, y = camera.cell_to_screen(r, c)
+        return Action(action=action, coords=(x + camera.cell_width // 2, y + camera.cell_height // 2))
+
+    def reveal_cell_id(self, cell_id: int):
+        """
+            Reveals cell_id as a click on it would, without going through the camera.
+        """
+        self.finish_reveal()
+        if self.stats.over:
+            return
+        self._curr_action = ActionType.REVEAL
+        self._curr_action_grid_row, self._curr_action_grid_col = self._grid.cells.id_to_grid_coords(cell_id)
+        self._reveal_cell()
+        return
+
+    def update_board(self, a: Action):
+        
+        self._set_current_event(a)
+
+        # Camera actions work anywhere on screen
+        if self._update_camera(a):
+            return
+
+        # A cascade counts as done as soon as it starts. Anything else that touches the
+        # board sees all of it
+        if a.action in (ActionType.REVEAL, ActionType.FLAG):
+            self.finish_reveal()
+            # The board is frozen once the game is decided
+            if self.stats.over:
+                return
+
+        # Clicks outside the board do nothing
+        if not self._grid.cells.in_bounds(self._curr_action_grid_row, self._curr_action_grid_col):
+            return
+
+        if self._curr_action == ActionType.REVEAL:
+            self._reveal_cell()
+        
+        elif self._curr_action == ActionType.FLAG:
+            #print("FLAG")
+            self._flag_cell()
+        
+        elif self._curr_action == ActionType.DRAG:
+            #print("DRAG")
+            self._drag_cell()
+
+    def _update_camera(self, a: Action) -> bool:
+        """
+            :return: Whether the action was for the camera, leaving the board alone
+        """
+        camera = self._config.camera
+        if a.action == ActionType.ZOOM_IN:
+            camera.zoom(1, a.coords)
+        elif a.action == ActionType.ZOOM_OUT:
+            camera.zoom(-1, a.coords)
+        elif a.action == ActionType.PAN_START:
+            camera.begin_pan(a.coords)
+        elif a.action == ActionType.PAN_END:
+            camera.pan_to(a.coords)
+            camera.end_pan()
+        elif a.action == ActionType.DRAG and camera.panning:
+            camera.pan_to(a.coords)
+        else:
+            return False
+        return True
+
+    def _count_revealed(self, n: int):
+        # Every reveal goes through here, which makes the win check constant time
+        stats = self.stats
+        stats.revealed += n
+        self.cascade_size += n
+        if trace.enabled:
+            trace.counter("reveal size", n)
+        if stats.revealed == stats.num_safe:
+            stats.state = GameState.WON
+        return
+
+    def recount_stats(self):
+        """
+            Rebuilds the counters from the board, for boards that were not played through
+            this Logic, like a loaded save. Clicks can't be recovered and start over.
+        """
+        cells = self._grid.cells
+        stats = self.stats
+        stats.revealed = int(np.count_nonzero(cells.revealed & ~cells.mines))
+        stats.flags = int(np.count_nonzero(cells.flagged))
+        self._grid.metadata.num_flags = stats.flags
+        stats.set_3bv_source(cells.compute_3bv if self._grid.mines_placed else None)
+
+        exploded = np.flatnonzero(cells.revealed & cells.mines)
+        stats.exploded = int(exploded[0]) if len(exploded) else None
+        if stats.exploded is not None:
+            stats.state = GameState.LOST
+        elif stats.revealed == stats.num_safe:
+            stats.state = GameState.WON
+        else:
+            stats.state = GameState.PLAYING
+        return
+
+    def _reveal_cell_bfs(self, r, c) -> List[int]:
+        cell_id = self._grid.cells.grid_coords_to_id(r, c)
+        if self.reveal_budget is None:
+            opened = self._grid.cells.flood_reveal(cell_id)
+            self._count_revealed(len(opened))
+            self._notify_cells_changed(opened)
+            return opened
+
+        self._pending_reveal = PendingReveal(self._grid.cells, cell_id)
+        return self.continue_reveal()
+
+    # Cells worked on between two checks of the clock, see PendingReveal.step() and
+    # PendingSpanReveal.step()
+    REVEAL_STEP_CELLS: int = 512
+
+    @property
+    def busy(self) -> bool:
+        """
+            True while a cascade is still being revealed. Callers should keep calling
+            continue_reveal() once a frame until it is done.
+        """
+        return self._pending_reveal is not None
+
+    def continue_reveal(self) -> Union[List[int], List[Tuple[int, int, int]]]:
+        """
+            Reveals more of the pending cascade, for up to reveal_budget seconds.
+
+            :return: Ids of the cells revealed by this call, or their spans in span mode
+        """
+        pending = self._pending_reveal
+        if pending is None:
+            return []
+
+        opened = []
+        deadline = time.perf_counter() + (self.reveal_budget or 0.0)
+        while True:
+            opened += pending.step(self.REVEAL_STEP_CELLS)
+            if pending.done:
+                self._pending_reveal = None
+                break
+            if time.perf_counter() >= deadline:
+                break
+
+        self._report_reveal(pending, opened)
+        return opened
+
+    def finish_reveal(self) -> Union[List[int], List[Tuple[int, int, int]]]:
+        """
+            Reveals what is left of the pending cascade, ignoring the budget.
+        """
+        pending = self._pending_reveal
+        if pending is None:
+            return []
+        self._pending_reveal = None
+        opened = pending.step()
+        self._report_reveal(pending, opened)
+        return opened
+
+    def _report_reveal(self, pending: Union[PendingReveal, PendingSpanReveal], opened: list):
+        if isinstance(pending, PendingSpanReveal):
+            self._count_revealed(sum(c1 - c0 for _, c0, c1 in opened))
+            self._notify_spans_changed(opened)
+        else:
+            self._count_revealed(len(opened))
+            self._notify_cells_changed(opened)
+        return
+
+    def _reveal_cell_spans(self, r, c) -> List[Tuple[int, int, int]]:
+        cell_id = self._grid.cells.grid_coords_to_id(r, c)
+        if self.reveal_budget is None:
+            spans = self._grid.cells.flood_reveal_spans(cell_id)
+            self._count_revealed(sum(c1 - c0 for _, c0, c1 in spans))
+            self._notify_spans_changed(spans)
+            return spans
+
+        self._pending_reveal = PendingSpanReveal(self._grid.cells, cell_id)
+        return self.continue_reveal()
+
+    def _reveal_cell(self):
+        r, c = self._curr_action_grid_row, self._curr_action_grid_col
+        cells = self._grid.cells
+        cell_id = cells.grid_coords_to_id(r, c)
+
+        if cells.flagged[cell_id] or cells.revealed[cell_id]:
+            if trace.enabled:
+                trace.instant("reveal ignored", cell=cell_id, flagged=bool(cells.flagged[cell_id]))
+            return False
+
+        # The board is only generated once we know where the first click is
+        if not self._grid.mines_placed:
+            self._grid.place_mines(cell_id)
+            self.stats.set_3bv_source(cells.compute_3bv)
+
+        self.stats.clicks += 1
+        self.cascade_size = 0
+        if cells.mines[cell_id]:
+            # The mine is shown, and the game ends. It is not a safe cell, so not counted
+            if trace.enabled:
+                trace.instant("mine hit", cell=cell_id)
+            cells.revealed[cell_id] = True
+            self.stats.state = GameState.LOST
+            self.stats.exploded = cell_id
+            self._notify_cells_changed([cell_id])
+        elif self._config.span_reveal:
+            with trace.span("reveal", cell=cell_id):
+                self._reveal_cell_spans(r, c)
+        else:
+            with trace.span("reveal", cell=cell_id):
+                self._reveal_cell_bfs(r, c)
+
+    def _flag_cell(self):
+        r, c = self._curr_action_grid_row, self._curr_action_grid_col
+        cells = self._grid.cells
+        cell_id = cells.grid_coords_to_id(r, c)
+
+        # Revealed cells can't carry a flag. Otherwise toggle it
+        if cells.revealed[cell_id]:
+            return False
+
+        cells.flagged[cell_id] = not cells.flagged[cell_id]
+        self.stats.flags += 1 if cells.flagged[cell_id] else -1
+        self.stats.clicks += 1
+        self._grid.metadata.num_flags = self.stats.flags
+        self._notify_cells_changed([cell_id])
+        return True
+
+    def _drag_cell(self):
+        pass
+    
+    def get_cell_rc_from_id(self, id: int) -> Tuple[int, int]:
+        return (id // self._config.num_columns, id % self._config.num_columns)
+    
+    def determine_adjacent_mine_count(self):
+        with trace.span("count pass"):
+            self._grid.cells.compute_adjacent_mine_counts()
+        return
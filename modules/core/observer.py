@@ -0,0 +1,31 @@
+from typing import Iterable, Tuple
+
+
+class BoardObserver():
+    """
+        Gets told about every change the game makes to the board.
+
+        The core never draws anything itself. Renderers, recorders and anything else that
+        follows the board subclass this and register with Logic.add_observer(). Every
+        method is a no-op by default.
+    """
+
+    def cells_changed(self, cell_ids: Iterable[int]):
+        """
+            Revealed or flagged state of these cells changed.
+        """
+        return
+
+    def spans_changed(self, spans: Iterable[Tuple[int, int, int]]):
+        """
+            Every cell in these (row, start column, end column) spans was revealed.
+            End column is exclusive.
+        """
+        return
+
+    def board_reset(self):
+        """
+            A new game started on the same board. Every cell is hidden and unflagged again,
+            changes made while setting up the new game follow as usual.
+        """
+        return
@@ -0,0 +1,171 @@
+"""
+    Frame time bookkeeping for the performance overlay and for finding stutters in the field.
+"""
+import time
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+
+class Histogram():
+    """
+        Log-linear histogram of non negative integer values, laid out like HdrHistogram.
+
+        Values below 2 ** significant_bits each get their own bucket. Above that, every
+        power of two range is split into 2 ** (significant_bits - 1) equal buckets, so a
+        value is kept to within 2 ** (1 - significant_bits) of itself, about 1.6% with
+        the default 7 bits, over the whole range. Recording is an index computation and
+        an increment, however many values have been recorded.
+    """
+
+    def __init__(self, max_value: int, significant_bits: int = 7):
+
+        self.significant_bits: int = significant_bits
+        self.max_value: int = max_value
+        self._sub_count: int = 1 << significant_bits
+        self._half: int = self._sub_count >> 1
+
+        self.counts: np.ndarray = np.zeros(self._index(max_value) + 1, dtype=np.int64)
+        self.total: int = 0
+        self.min: Optional[int] = None
+        self.max: int = 0
+        self._sum: int = 0
+        self._sum_squares: int = 0
+        return
+
+    def _index(self, value: int) -> int:
+        if value < self._sub_count:
+            return value
+        shift = value.bit_length() - self.significant_bits
+        return shift * self._half + (value >> shift)
+
+    def _bucket_low(self, index: np.ndarray) -> np.ndarray:
+        shift = np.maximum(index // self._half - 1, 0)
+        return (index - shift * self._half) << shift
+
+    def _bucket_high(self, index: np.ndarray) -> np.ndarray:
+        # Highest value that lands in the bucket, what percentiles report
+        shift = np.maximum(index // self._half - 1, 0)
+        return self._bucket_low(index) + (1 << shift) - 1
+
+    def record(self, value: int):
+        """
+            Values past max_value are counted as max_value.
+        """
+        value = min(max(int(value), 0), self.max_value)
+        self.counts[self._index(value)] += 1
+        self.total += 1
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = max(self.max, value)
+        self._sum += value
+        self._sum_squares += value * value
+        return
+
+    @property
+    def mean(self) -> float:
+        return self._sum / self.total if self.total else 0.0
+
+    @property
+    def stddev(self) -> float:
+        if not self.total:
+            return 0.0
+        mean = self.mean
+        return max(self._sum_squares / self.total - mean * mean, 0.0) ** 0.5
+
+    def percentiles(self, ps: Sequence[float]) -> List[int]:
+        """
+            :param ps: Percentiles, 0 to 100
+            :return: For each, the highest value equivalent to the one at that percentile
+        """
+        if not self.total:
+            return [0 for _ in ps]
+        cumulative = np.cumsum(self.counts)
+        ranks = np.maximum(np.ceil(np.asarray(ps, dtype=np.float64) / 100 * self.total), 1)
+        index = np.searchsorted(cumulative, ranks)
+        return np.minimum(self._bucket_high(index), self.max).tolist()
+
+    def write_percentile_distribution(self, path: str, unit_scale: float = 1.0, ticks_per_half: int = 5):
+        """
+            Writes the distribution in HdrHistogram's text format, which its plotting
+            tools read. Percentiles are ticked ticks_per_half times in every halving of
+            the distance to 100%.
+
+            :param unit_scale: Values are divided by this on output, e.g. 1000 for us to ms
+        """
+        ps: List[float] = []
+        for level in range(64):
+            low = 1 - 0.5 ** level
+            high = 1 - 0.5 ** (level + 1)
+            ps.extend(low + k * (high - low) / ticks_per_half for k in range(ticks_per_half))
+            # Past here every tick would land on the last value
+            if (1 - high) * self.total < 1:
+                break
+        ps.append(1.0)
+
+        values = self.percentiles([p * 100 for p in ps])
+        cumulative = np.cumsum(self.counts)
+        with open(path, "w") as f:
+            f.write(f"{'Value':>12} {'Percentile':>14} {'TotalCount':>10} {'1/(1-Percentile)':>14}\n\n")
+            for p, value in zip(ps, values):
+                count = int(cumulative[self._index(value)]) if self.total else 0
+                inverse = f"{1 / (1 - p):14.2f}" if p < 1 else f"{'inf':>14}"
+                f.write(f"{value / unit_scale:12.3f} {p:14.12f} {count:10d} {inverse}\n")
+            f.write(f"#[Mean    = {self.mean / unit_scale:12.3f}, StdDeviation   = {self.stddev / unit_scale:12.3f}]\n")
+            f.write(f"#[Max     = {self.max / unit_scale:12.3f}, Total count    = {self.total:12d}]\n")
+            f.write(f"#[Buckets = {len(self.counts):12d}, SubBuckets     = {self._sub_count:12d}]\n")
+        return
+
+
+class FrameStats():
+    """
+        Work time and action count of every frame.
+
+        Every frame goes into a histogram, in microseconds, for the whole session. The
+        last window frames are also kept as they are, for figures about right now.
+    """
+    # A minute, in microseconds. Longer frames count as this long
+    MAX_FRAME_US: int = 60_000_000
+
+    def __init__(self, window: int = 240):
+
+        self.histogram: Histogram = Histogram(self.MAX_FRAME_US)
+
+        # Ring buffers, slot i holds frame number i % window
+        self._seconds: np.ndarray = np.zeros(window)
+        self._ends: np.ndarray = np.zeros(window)
+        self._actions: np.ndarray = np.zeros(window, dtype=np.int64)
+        self.frames: int = 0
+        return
+
+    def record(self, seconds: float, actions: int = 0, end: Optional[float] = None):
+        """
+            :param end: time.perf_counter() at the end of the frame, now if None
+        """
+        i = self.frames % len(self._seconds)
+        self._seconds[i] = seconds
+        self._ends[i] = time.perf_counter() if end is None else end
+        self._actions[i] = actions
+        self.frames += 1
+        self.histogram.record(int(seconds * 1e6))
+        return
+
+    @property
+    def last(self) -> float:
+        return float(self._seconds[(self.frames - 1) % len(self._seconds)]) if self.frames else 0.0
+
+    def recent_percentiles(self, ps: Sequence[float]) -> List[float]:
+        """
+            Percentiles of the frame times in the window, in seconds.
+        """
+        n = min(self.frames, len(self._seconds))
+        if not n:
+            return [0.0 for _ in ps]
+        return np.percentile(self._seconds[:n], ps).tolist()
+
+    def actions_per_second(self, now: Optional[float] = None) -> int:
+        """
+            Actions applied in the frames that ended during the last second.
+        """
+        now = time.perf_counter() if now is None else now
+        n = min(self.frames, len(self._seconds))
+        return int(self._actions[:n][self._ends[:n] > now - 1.0].sum())
@@ -0,0 +1,331 @@
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from functools import lru_cache
+from math import comb
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from .board import Board
+from .game import CoreGame
+
+
+# A constraint is (unknown neighbor ids, mines among them)
+Constraint = Tuple[Tuple[int, ...], int]
+
+# Sorted constraints of one frontier component, used as its cache key
+Signature = Tuple[Constraint, ...]
+
+
+@lru_cache(maxsize=256)
+def _binomial_weights(num_interior: int, mines_left: int, max_frontier_mines: int) -> Tuple[int, ...]:
+    """
+        C(num_interior, mines_left - k) for k = 0..max_frontier_mines.
+
+        Ways to place the mines the frontier does not hold among the interior cells.
+        Built with the C(n, m - 1) = C(n, m) * m / (n - m + 1) recurrence, so only one
+        full binomial is ever computed per table.
+    """
+    weights: List[int] = []
+    current = None
+    for k in range(0, max_frontier_mines + 1):
+        m = mines_left - k
+        if m < 0 or m > num_interior:
+            weights.append(0)
+            current = None
+            continue
+        if current is None:
+            current = comb(num_interior, m)
+        else:
+            current = current * (m + 1) // (num_interior - m)
+        weights.append(current)
+    return tuple(weights)
+
+
+@dataclass
+class ComponentSolutions:
+    """
+        Every way to place mines in one frontier component.
+
+        solutions[k]       -> number of placements with exactly k mines
+        cell_mines[k][i]   -> how many of those have a mine on cells[i]
+    """
+    cells: Tuple[int, ...]
+    solutions: List[int]
+    cell_mines: List[List[int]]
+
+
+@dataclass
+class MineProbabilities:
+    # Frontier cell id -> chance it holds a mine
+    frontier: Dict[int, float] = field(default_factory=dict)
+    # Chance for any unknown cell not touching a revealed number
+    interior: float = 0.0
+    num_interior: int = 0
+    num_components: int = 0
+    # Cells proven safe or proven mines. Exact, unlike comparing the floats to 0 and 1
+    safe: List[int] = field(default_factory=list)
+    mines: List[int] = field(default_factory=list)
+
+
+class ProbabilityEngine():
+    """
+        Exact mine probabilities for every unknown cell, from the player's view.
+
+        Flags are taken as mines. The frontier (unknown cells next to a revealed number)
+        is split into components that share no constraint, and each component is
+        enumerated on its own, so the cost is exponential in the largest component
+        instead of the whole frontier. Components are then combined by how many mines
+        each holds, weighted by the number of ways to put the rest of the mines in the
+        interior.
+
+        Component results are cached on their constraint signature. A move only changes
+        the components it touches, every other one is a cache hit next time. Only the
+        max_cache_size most recently used are kept, signatures of earlier positions and
+        earlier games are seldom seen again.
+    """
+
+    def __init__(self, game: CoreGame, max_cache_size: int = 4096):
+
+        self._game: CoreGame = game
+        self._board: Board = game.grid.cells
+        self._cache: "OrderedDict[Signature, ComponentSolutions]" = OrderedDict()
+        self.max_cache_size: int = max_cache_size
+
+        self.cache_hits: int = 0
+        self.cache_misses: int = 0
+        return
+
+    def compute(self) -> MineProbabilities:
+        board = self._board
+        unknown = ~(board.revealed | board.flagged)
+
+        components = [self._solve(sig) for sig in self._components(unknown)]
+
+        num_frontier = sum(len(c.cells) for c in components)
+        num_interior = int(unknown.sum()) - num_frontier
+        mines_left = self._game.config.num_mines - int(board.flagged.sum())
+
+        # Mine count distribution of the whole frontier, and of the frontier minus each component
+        totals = [c.solutions for c in components]
+        full = _convolve_all(totals)
+        others = _leave_one_out(totals)
+
+        weights = _binomial_weights(num_interior, mines_left, len(full) - 1)
+        total_weight = sum(n * w for n, w in zip(full, weights))
+        if total_weight == 0:
+            raise ValueError("No mine placement matches the revealed numbers and flags")
+
+        result = MineProbabilities(num_interior=num_interior, num_components=len(components))
+
+        for comp, rest in zip(components, others):
+            # Weight of the rest of the board given this component holds k mines
+            rest_weight = [
+                sum(n * weights[k + r] for r, n in enumerate(rest))
+                for k in range(0, len(comp.solutions))
+            ]
+            for i, cell_id in enumerate(comp.cells):
+                num = sum(comp.cell_mines[k][i] * rest_weight[k] for k in range(0, len(comp.solutions)))
+                result.frontier[cell_id] = num / total_weight
+                if num == 0:
+                    result.safe.append(cell_id)
+                elif num == total_weight:
+                    result.mines.append(cell_id)
+
+        if num_interior > 0:
+            interior_mines = sum(n * w * (mines_left - k) for k, (n, w) in enumerate(zip(full, weights)))
+            result.interior = interior_mines / (total_weight * num_interior)
+
+            if interior_mines == 0 or interior_mines == total_weight * num_interior:
+                interior = unknown.copy()
+                interior[list(result.frontier)] = False
+                ids = np.flatnonzero(interior).tolist()
+                if interior_mines == 0:
+                    result.safe += ids
+                else:
+                    result.mines += ids
+
+        return result
+
+    def _components(self, unknown: np.ndarray) -> List[Signature]:
+        """
+            Splits the frontier constraints into independent components.
+        """
+        board = self._board
+        flagged = board.flagged
+
+        # Revealed numbers that still touch an unknown cell
+        cols = board.num_columns
+        padded = np.zeros((board.num_rows + 2, cols + 2), dtype=bool)
+        padded[1:-1, 1:-1] = unknown.reshape(board.num_rows, cols)
+        touches = np.zeros((board.num_rows, cols), dtype=bool)
+        for dr, dc in board.cell_neighbors:
+            touches |= padded[1 + dr:1 + dr + board.num_rows, 1 + dc:1 + dc + cols]
+        numbers = np.flatnonzero(board.revealed & touches.ravel())
+
+        constraints: List[Constraint] = []
+        for cell_id in numbers.tolist():
+            cells = []
+            mines = int(board.adjacent[cell_id])
+            for n_id in board.neighbor_ids(cell_id):
+                if flagged[n_id]:
+                    mines -= 1
+                elif unknown[n_id]:
+                    cells.append(n_id)
+            constraints.append((tuple(sorted(cells)), mines))
+
+        # Union find over frontier cells, joined through the constraints they share
+        parent: Dict[int, int] = {}
+
+        def find(x: int) -> int:
+            while parent[x] != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            return x
+
+        for cells, _ in constraints:
+            for cell_id in cells:
+                parent.setdefault(cell_id, cell_id)
+            root = find(cells[0])
+            for cell_id in cells[1:]:
+                other = find(cell_id)
+                if other != root:
+                    parent[other] = root
+
+        groups: Dict[int, List[Constraint]] = {}
+        for con in constraints:
+            groups.setdefault(find(con[0][0]), []).append(con)
+
+        return [tuple(sorted(set(group))) for group in groups.values()]
+
+    def _solve(self, signature: Signature) -> ComponentSolutions:
+        solved = self._cache.get(signature)
+        if solved is not None:
+            self._cache.move_to_end(signature)
+            self.cache_hits += 1
+            return solved
+
+        self.cache_misses += 1
+        solved = _enumerate(signature)
+        self._cache[signature] = solved
+        if len(self._cache) > self.max_cache_size:
+            self._cache.popitem(last=False)
+        return solved
+
+    def clear_cache(self):
+        self._cache.clear()
+        return
+
+
+def _enumerate(signature: Signature) -> ComponentSolutions:
+    """
+        Backtracks over every mine placement of one component.
+    """
+    # Visit cells constraint by constraint so constraints fill up, and prune, early
+    order: List[int] = []
+    seen = set()
+    for cells, _ in signature:
+        for cell_id in cells:
+            if cell_id not in seen:
+                seen.add(cell_id)
+                order.append(cell_id)
+    index = {cell_id: i for i, cell_id in enumerate(order)}
+    n = len(order)
+
+    targets = [mines for _, mines in signature]
+    open_cells = [len(cells) for cells, _ in signature]
+    placed = [0] * len(signature)
+    cell_constraints: List[List[int]] = [[] for _ in range(0, n)]
+    for ci, (cells, _) in enumerate(signature):
+        for cell_id in cells:
+            cell_constraints[index[cell_id]].append(ci)
+
+    solutions = [0] * (n + 1)
+    cell_mines = [[0] * n for _ in range(0, n + 1)]
+    mines: List[int] = []
+
+    def assign(i: int, value: int) -> bool:
+        ok = True
+        for ci in cell_constraints[i]:
+            open_cells[ci] -= 1
+            placed[ci] += value
+            if placed[ci] > targets[ci] or placed[ci] + open_cells[ci] < targets[ci]:
+                ok = False
+        return ok
+
+    def unassign(i: int, value: int):
+        for ci in cell_constraints[i]:
+            open_cells[ci] += 1
+            placed[ci] -= value
+        return
+
+    # Depth first with an explicit stack, components can be deeper than the recursion
+    # limit. values[i] is the value cell i holds, 0 then 1, or -1 before either is tried
+    values = [-1] * n
+    i = 0
+    while i >= 0:
+        if i == n:
+            k = len(mines)
+            solutions[k] += 1
+            row = cell_mines[k]
+            for m in mines:
+                row[m] += 1
+            i -= 1
+            continue
+
+        value = values[i]
+        if value >= 0:
+            unassign(i, value)
+            if value:
+                mines.pop()
+        if value == 1:
+            # Both values done, back up
+            values[i] = -1
+            i -= 1
+            continue
+
+        value += 1
+        values[i] = value
+        if value:
+            mines.append(i)
+        if assign(i, value):
+            i += 1
+
+    # Back to the sorted cell order the signature uses
+    cells = tuple(sorted(order))
+    perm = [index[cell_id] for cell_id in cells]
+    cell_mines = [[row[p] for p in perm] for row in cell_mines]
+    return ComponentSolutions(cells, solutions, cell_mines)
+
+
+def _convolve(a: List[int], b: List[int]) -> List[int]:
+    out = [0] * (len(a) + len(b) - 1)
+    for i, x in enumerate(a):
+        if x:
+            for j, y in enumerate(b):
+                out[i + j] += x * y
+    return out
+
+
+def _convolve_all(polys: List[List[int]]) -> List[int]:
+    out = [1]
+    for p in polys:
+        out = _convolve(out, p)
+    return out
+
+
+def _leave_one_out(polys: List[List[int]]) -> List[List[int]]:
+    """
+        For every poly, the product of all the others. Prefix and suffix products, so
+        this is linear in the number of components instead of quadratic.
+    """
+    prefix = [[1]]
+    for p in polys:
+        prefix.append(_convolve(prefix[-1], p))
+
+    out: List[List[int]] = [[]] * len(polys)
+    suffix = [1]
+    for j in range(len(polys) - 1, -1, -1):
+        out[j] = _convolve(prefix[j], suffix)
+        suffix = _convolve(suffix, polys[j])
+    return out
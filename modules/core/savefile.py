@@ -0,0 +1,201 @@
+"""
+    Binary save format, little endian:
+
+        HEADER_SIZE byte header, see SaveHeader
+        mines    bit plane
+        revealed bit plane
+        flagged  bit plane
+
+    A bit plane is one bit per cell in cell id order, packed with np.packbits (first cell
+    in the high bit) and padded to a whole byte. Adjacent counts are not saved, they are
+    rebuilt from the mines in one vectorized pass.
+"""
+import mmap
+import os
+import struct
+from dataclasses import dataclass, replace
+from typing import Optional
+
+import numpy as np
+
+from ..settings import Settings
+from .board import Board
+from .game import CoreGame
+
+
+MAGIC = b"MSWB"
+FORMAT_VERSION = 1
+HEADER_SIZE = 64
+
+# magic, version, flags, rows, columns, mines, seed, revealed count, flag count
+_HEADER = struct.Struct("<4sHHIIIqQQ")
+
+_HAS_SEED = 1
+_MINES_PLACED = 2
+
+# Cells packed or unpacked per pass, keeps memory flat on huge boards. Multiple of 8
+_PLANE_STEP = 1 << 24
+
+
+@dataclass(frozen=True)
+class SaveHeader:
+    num_rows: int
+    num_columns: int
+    num_mines: int
+    seed: Optional[int]
+    # False for a game saved before its first click. Its mine plane is empty
+    mines_placed: bool
+    num_revealed: int
+    num_flags: int
+
+    @property
+    def num_cells(self) -> int:
+        return self.num_rows * self.num_columns
+
+    @property
+    def plane_size(self) -> int:
+        return (self.num_cells + 7) // 8
+
+    def pack(self) -> bytes:
+        flags = (_HAS_SEED if self.seed is not None else 0) | (_MINES_PLACED if self.mines_placed else 0)
+        data = _HEADER.pack(MAGIC, FORMAT_VERSION, flags, self.num_rows, self.num_columns, self.num_mines,
+                            self.seed if self.seed is not None else 0, self.num_revealed, self.num_flags)
+        return data.ljust(HEADER_SIZE, b"\0")
+
+    @classmethod
+    def unpack(cls, buf) -> "SaveHeader":
+        if len(buf) < HEADER_SIZE:
+            raise ValueError("Not a save file, too short for the header")
+        magic, version, flags, rows, cols, mines, seed, revealed, num_flags = _HEADER.unpack_from(buf)
+        if magic != MAGIC:
+            raise ValueError("Not a save file, bad magic")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"Unsupported save format version {version}, expected {FORMAT_VERSION}")
+        return cls(rows, cols, mines, seed if flags & _HAS_SEED else None, bool(flags & _MINES_PLACED),
+                   revealed, num_flags)
+
+    @property
+    def file_size(self) -> int:
+        return HEADER_SIZE + 3 * self.plane_size
+
+    def check_file_size(self, size: int):
+        if size < self.file_size:
+            raise ValueError("Save file is truncated")
+        return
+
+    def settings(self, base: Optional[Settings] = None) -> Settings:
+        """
+            base with the board size, mine count and seed of the save. Never no-guess,
+            the board comes from the save.
+        """
+        return replace(base if base is not None else Settings(), num_rows=self.num_rows,
+                       num_columns=self.num_columns, num_mines=self.num_mines, seed=self.seed,
+                       no_guess=False)
+
+
+def _write_plane(f, plane: np.ndarray):
+    for i in range(0, len(plane), _PLANE_STEP):
+        f.write(np.packbits(plane[i:i + _PLANE_STEP]).tobytes())
+    return
+
+
+def _read_plane(buf, offset: int, plane: np.ndarray):
+    # Unpacks straight from buf, a step at a time, into plane
+    n = len(plane)
+    for i in range(0, n, _PLANE_STEP):
+        count = min(_PLANE_STEP, n - i)
+        packed = np.frombuffer(buf, dtype=np.uint8, count=(count + 7) // 8, offset=offset + i // 8)
+        plane[i:i + count] = np.unpackbits(packed, count=count).view(np.bool_)
+    return
+
+
+def save_game(game: CoreGame, path: str):
+    """
+        Writes the board of game to path. Goes through a temporary file, so a crash never
+        leaves a half written save behind.
+    """
+    cells: Board = game.grid.cells
+    header = SaveHeader(cells.num_rows, cells.num_columns, game.config.num_mines, game.settings.seed,
+                        game.grid.mines_placed, int(np.count_nonzero(cells.revealed)),
+                        int(np.count_nonzero(cells.flagged)))
+
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(header.pack())
+        _write_plane(f, cells.mines)
+        _write_plane(f, cells.revealed)
+        _write_plane(f, cells.flagged)
+    os.replace(tmp_path, path)
+    return
+
+
+def read_header(path: str) -> SaveHeader:
+    with open(path, "rb") as f:
+        head = f.read(HEADER_SIZE)
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+    header = SaveHeader.unpack(head)
+    header.check_file_size(size)
+    return header
+
+
+def load_into(game: CoreGame, path: str) -> SaveHeader:
+    """
+        Restores a save into game, which must have the same board size.
+
+        The file is memory mapped and the bit planes are unpacked straight from the map
+        into the board, nothing is parsed. Meant for a freshly created game, observers are
+        not told about the restored cells.
+    """
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+        header = SaveHeader.unpack(buf)
+        header.check_file_size(len(buf))
+        cells: Board = game.grid.cells
+        if (header.num_rows, header.num_columns) != (cells.num_rows, cells.num_columns):
+            raise ValueError(f"Save is {header.num_rows}x{header.num_columns}, "
+                             f"game is {cells.num_rows}x{cells.num_columns}")
+
+        planes = HEADER_SIZE
+        _read_plane(buf, planes, cells.mines)
+        _read_plane(buf, planes + header.plane_size, cells.revealed)
+        _read_plane(buf, planes + 2 * header.plane_size, cells.flagged)
+
+    grid = game.grid
+    if header.mines_placed:
+        grid.metadata.mine_ids = np.flatnonzero(cells.mines)
+        cells.compute_adjacent_mine_counts()
+    grid.mines_placed = header.mines_placed
+    game.logic.recount_stats()
+    return header
+
+
+def load_game(path: str, settings: Optional[Settings] = None) -> CoreGame:
+    """
+        New headless game from a save.
+
+        :param settings: Everything but the board size, mine count and seed, which come
+                         from the save
+    """
+    header = read_header(path)
+    game = CoreGame(header.settings(settings))
+    load_into(game, path)
+    return game
+
+
+def read_mine_ids_text(path: str, num_columns: int) -> np.ndarray:
+    """
+        Mine ids from a text file of "r c" lines, like mine_ids.txt.
+    """
+    rc = np.loadtxt(path, dtype=np.int64, ndmin=2)
+    return np.sort(rc[:, 0] * num_columns + rc[:, 1])
+
+
+def import_mine_ids_text(text_path: str, save_path: str, settings: Settings):
+    """
+        Converts a text mine list into a save of an unplayed game with those mines.
+        Board size comes from settings, the mine count from the file.
+    """
+    mine_ids = read_mine_ids_text(text_path, settings.num_columns)
+    settings = replace(settings, num_mines=len(mine_ids))
+    save_game(CoreGame(settings, mine_ids=mine_ids), save_path)
+    return
@@ -0,0 +1,157 @@
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Callable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from ..settings import Settings
+from ..event_handler.eventEnums import ActionType
+from .game import CoreGame
+from .probability import ProbabilityEngine
+from .solver import Solver
+
+
+class GuessPolicy(Enum):
+    # Any unknown cell the solver has not proven to be a mine
+    RANDOM = "random"
+    # Lowest mine probability from ProbabilityEngine
+    SAFEST = "safest"
+
+
+# (seed, won, guesses, safe cells revealed)
+GameRecord = Tuple[int, int, int, int]
+
+# Second entry of the guess RNG seed, so guesses never share a stream with mine placement
+_GUESS_STREAM = 1
+
+
+@dataclass(frozen=True)
+class SimulationParams:
+    num_rows: int
+    num_columns: int
+    num_mines: int
+    policy: GuessPolicy = GuessPolicy.SAFEST
+
+
+def play_game(params: SimulationParams, seed: int) -> GameRecord:
+    """
+        Plays one game to the end, starting in the middle of the board.
+
+        The solver plays every safe move it can find. When it gets stuck the policy
+        picks a guess. The result only depends on params and seed.
+    """
+    game = CoreGame(Settings(num_rows=params.num_rows, num_columns=params.num_columns,
+                             num_mines=params.num_mines, seed=seed))
+    board = game.grid.cells
+    logic = game.logic
+
+    solver = Solver(game)
+    engine = ProbabilityEngine(game) if params.policy == GuessPolicy.SAFEST else None
+    rng = np.random.default_rng([seed, _GUESS_STREAM])
+
+    stats = game.stats
+    cell_id = board.grid_coords_to_id(board.num_rows // 2, board.num_columns // 2)
+    guesses = 0
+
+    while True:
+        guesses += 1
+
+        # The first click is always safe
+        game.apply_action(logic.cell_action(ActionType.REVEAL, *board.id_to_grid_coords(cell_id)))
+        if stats.lost:
+            return (seed, 0, guesses, stats.revealed)
+
+        solver.run()
+        if stats.won:
+            return (seed, 1, guesses, stats.revealed)
+
+        cell_id = _pick_guess(board, engine, rng)
+
+
+def _pick_guess(board, engine: Optional[ProbabilityEngine], rng: np.random.Generator) -> int:
+    unknown = ~(board.revealed | board.flagged)
+
+    if engine is None:
+        return int(rng.choice(np.flatnonzero(unknown)))
+
+    probs = engine.compute()
+    best = min(probs.frontier.values(), default=1.0)
+    if probs.num_interior > 0 and probs.interior < best:
+        # Interior cells all share one probability, any of them will do
+        interior = unknown.copy()
+        interior[list(probs.frontier)] = False
+        return int(rng.choice(np.flatnonzero(interior)))
+
+    candidates = sorted(cell_id for cell_id, p in probs.frontier.items() if p == best)
+    return int(candidates[rng.integers(len(candidates))])
+
+
+def _play_shard(params: SimulationParams, seeds: List[int]) -> List[GameRecord]:
+    return [play_game(params, seed) for seed in seeds]
+
+
+@dataclass
+class SimulationResults:
+    """
+        Running totals, updated as shards come back. Only sums of integers are kept,
+        so the totals do not depend on the order shards finish in.
+    """
+    games: int = 0
+    wins: int = 0
+    guesses: int = 0
+    revealed: int = 0
+    # Losses on the first guess after the opening click, which is always safe
+    first_guess_losses: int = 0
+    losing_seeds: List[int] = field(default_factory=list)
+
+    def add(self, record: GameRecord):
+        seed, won, guesses, revealed = record
+        self.games += 1
+        self.wins += won
+        self.guesses += guesses
+        self.revealed += revealed
+        if not won:
+            self.losing_seeds.append(seed)
+            if guesses == 2:
+                self.first_guess_losses += 1
+        return
+
+    @property
+    def win_rate(self) -> float:
+        return self.wins / self.games if self.games else 0.0
+
+    @property
+    def win_rate_stderr(self) -> float:
+        if self.games == 0:
+            return 0.0
+        p = self.win_rate
+        return (p * (1 - p) / self.games) ** 0.5
+
+
+def iter_records(params: SimulationParams, seeds: range, workers: Optional[int] = None,
+                 shard_size: int = 64) -> Iterator[GameRecord]:
+    """
+        Plays one game per seed across a process pool, yielding records as shards finish.
+
+        :param workers: Defaults to one per core
+    """
+    shards = [list(seeds[i:i + shard_size]) for i in range(0, len(seeds), shard_size)]
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_play_shard, params, shard) for shard in shards]
+        for future in as_completed(futures):
+            yield from future.result()
+    return
+
+
+def simulate(params: SimulationParams, seeds: range, workers: Optional[int] = None, shard_size: int = 64,
+             on_record: Optional[Callable[[GameRecord], None]] = None) -> SimulationResults:
+    results = SimulationResults()
+    for record in iter_records(params, seeds, workers, shard_size):
+        results.add(record)
+        if on_record is not None:
+            on_record(record)
+
+    results.losing_seeds.sort()
+    return results
@@ -0,0 +1,203 @@
+from typing import Dict, FrozenSet, Iterable, List, Set, Tuple
+
+import numpy as np
+
+from .board import Board
+from .game import CoreGame
+from .observer import BoardObserver
+from ..event_handler.eventAction import Action
+from ..event_handler.eventEnums import ActionType
+
+
+class Solver(BoardObserver):
+    """
+        Deterministic constraint propagation solver.
+
+        Plays from what the player can see: revealed counts and flags. Never looks at
+        where the mines are. Every revealed numbered cell gives a constraint, "this many
+        mines among these unknown neighbors", and two rules are applied to them:
+
+            single cell -> no mines left means every unknown neighbor is safe, as many
+                           mines left as unknown neighbors means they are all mines
+            subset      -> if the unknowns of A are a subset of the unknowns of B, the
+                           cells only B sees hold exactly mines(B) - mines(A) mines
+
+        Only constraints near cells that changed are looked at again. The solver follows
+        the board as an observer, so reveals and flags made by anyone, including the
+        actions it hands out, mark the touched constraints dirty.
+    """
+
+    def __init__(self, game: CoreGame):
+
+        self._game: CoreGame = game
+        self._board: Board = game.grid.cells
+
+        # Deduced, but not yet handed out as actions
+        self._pending_safe: Set[int] = set()
+        self._pending_mines: Set[int] = set()
+
+        # Everything deduced so far
+        self._known_safe: Set[int] = set()
+        self._known_mines: Set[int] = set()
+
+        # Revealed cells whose constraint may have changed
+        self._dirty: Set[int] = set(np.flatnonzero(self._board.revealed).tolist())
+
+        game.add_observer(self)
+        return
+
+    def detach(self):
+        self._game.logic.remove_observer(self)
+        return
+
+    # BoardObserver
+    def cells_changed(self, cell_ids: Iterable[int]):
+        for cell_id in cell_ids:
+            self._touch(cell_id)
+        return
+
+    def spans_changed(self, spans: Iterable[Tuple[int, int, int]]):
+        cols = self._board.num_columns
+        for r, c0, c1 in spans:
+            for cell_id in range(r * cols + c0, r * cols + c1):
+                self._touch(cell_id)
+        return
+
+    def board_reset(self):
+        # Nothing deduced about the old board holds on the new one
+        self._pending_safe.clear()
+        self._pending_mines.clear()
+        self._known_safe.clear()
+        self._known_mines.clear()
+        self._dirty = set(np.flatnonzero(self._board.revealed).tolist())
+        return
+
+    def _touch(self, cell_id: int):
+        # The cell's own constraint and those of its revealed neighbors need a new look
+        revealed = self._board.revealed
+        if revealed[cell_id]:
+            self._dirty.add(cell_id)
+        for n_id in self._board.neighbor_ids(cell_id):
+            if revealed[n_id]:
+                self._dirty.add(n_id)
+        return
+
+    @property
+    def known_safe(self) -> FrozenSet[int]:
+        return frozenset(self._known_safe)
+
+    @property
+    def known_mines(self) -> FrozenSet[int]:
+        return frozenset(self._known_mines)
+
+    def step(self) -> List[Action]:
+        """
+            Propagates every dirty constraint, then hands out what was deduced.
+
+            :return: REVEAL actions for safe cells and FLAG actions for mines, ready for
+                     Logic.update_board(). Empty when nothing more can be deduced.
+        """
+        self._propagate()
+
+        logic = self._game.logic
+        board = self._board
+        actions: List[Action] = []
+
+        for cell_id in sorted(self._pending_safe):
+            if not board.revealed[cell_id]:
+                actions.append(logic.cell_action(ActionType.REVEAL, *board.id_to_grid_coords(cell_id)))
+        for cell_id in sorted(self._pending_mines):
+            if not board.flagged[cell_id]:
+                actions.append(logic.cell_action(ActionType.FLAG, *board.id_to_grid_coords(cell_id)))
+
+        self._pending_safe.clear()
+        self._pending_mines.clear()
+        return actions
+
+    def run(self) -> int:
+        """
+            Applies the solver's actions to the game until it gets stuck.
+
+            :return: Number of actions applied
+        """
+        applied = 0
+        actions = self.step()
+        while actions:
+            self._game.apply_actions(actions)
+            applied += len(actions)
+            actions = self.step()
+        return applied
+
+    def _constraint(self, cell_id: int) -> Tuple[FrozenSet[int], int]:
+        """
+            :return: Unknown neighbors of a revealed cell and how many mines are among them
+        """
+        board = self._board
+        unknown = []
+        mines = 0
+        for n_id in board.neighbor_ids(cell_id):
+            if board.flagged[n_id] or n_id in self._known_mines:
+                mines += 1
+            elif not (board.revealed[n_id] or n_id in self._known_safe):
+                unknown.append(n_id)
+        return frozenset(unknown), int(board.adjacent[cell_id]) - mines
+
+    def _mark_safe(self, cell_ids: Iterable[int]):
+        for cell_id in cell_ids:
+            if cell_id not in self._known_safe:
+                self._known_safe.add(cell_id)
+                self._pending_safe.add(cell_id)
+                self._touch(cell_id)
+        return
+
+    def _mark_mines(self, cell_ids: Iterable[int]):
+        for cell_id in cell_ids:
+            if cell_id not in self._known_mines:
+                self._known_mines.add(cell_id)
+                self._pending_mines.add(cell_id)
+                self._touch(cell_id)
+        return
+
+    def _propagate(self):
+        board = self._board
+
+        while self._dirty:
+            cell_id = self._dirty.pop()
+            unknown, mines = self._constraint(cell_id)
+            if not unknown:
+                continue
+
+            # Single cell rule
+            if mines == 0:
+                self._mark_safe(unknown)
+                continue
+            if mines == len(unknown):
+                self._mark_mines(unknown)
+                continue
+
+            # Subset rule against every revealed cell that shares an unknown with this one
+            others: Set[int] = set()
+            for u in unknown:
+                for n_id in board.neighbor_ids(u):
+                    if n_id != cell_id and board.revealed[n_id]:
+                        others.add(n_id)
+
+            constraints: Dict[int, Tuple[FrozenSet[int], int]] = {o: self._constraint(o) for o in others}
+            for other, (other_unknown, other_mines) in constraints.items():
+                if not other_unknown:
+                    continue
+                if unknown < other_unknown:
+                    self._apply_subset(unknown, mines, other_unknown, other_mines)
+                elif other_unknown < unknown:
+                    self._apply_subset(other_unknown, other_mines, unknown, mines)
+
+        return
+
+    def _apply_subset(self, small: FrozenSet[int], small_mines: int, big: FrozenSet[int], big_mines: int):
+        rest = big - small
+        rest_mines = big_mines - small_mines
+        if rest_mines == 0:
+            self._mark_safe(rest)
+        elif rest_mines == len(rest):
+            self._mark_mines(rest)
+        return
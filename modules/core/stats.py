@@ -0,0 +1,69 @@
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+from .enums import GameState
+
+
+@dataclass
+class GameStats:
+    """
+        Running counters of a game, kept up to date by Logic as cells change.
+
+        Reading them never touches the board, and win and loss follow from them in
+        constant time.
+    """
+    num_safe: int
+    num_mines: int
+
+    # Safe cells revealed. The only mine ever revealed is the one that ended the game
+    revealed: int = 0
+    flags: int = 0
+    # Reveals and flags that changed the board
+    clicks: int = 0
+    state: GameState = GameState.PLAYING
+    # Mine that ended the game, if one did
+    exploded: Optional[int] = None
+
+    # See board_3bv. Worked out on first read, the reveal path never pays for it
+    _board_3bv: Optional[int] = field(default=None, init=False, repr=False)
+    _compute_3bv: Optional[Callable[[], int]] = field(default=None, init=False, repr=False, compare=False)
+
+    def set_3bv_source(self, compute: Optional[Callable[[], int]]):
+        """
+            :param compute: Works out the 3BV of the board, once its mines are placed
+        """
+        self._compute_3bv = compute
+        self._board_3bv = None
+        return
+
+    @property
+    def board_3bv(self) -> Optional[int]:
+        """
+            Fewest clicks that clear the board. None until mines are placed.
+        """
+        if self._board_3bv is None and self._compute_3bv is not None:
+            self._board_3bv = self._compute_3bv()
+        return self._board_3bv
+
+    @property
+    def remaining_mines(self) -> int:
+        """
+            Mines not yet flagged, going by the flag count. Negative with too many flags.
+        """
+        return self.num_mines - self.flags
+
+    @property
+    def remaining_safe(self) -> int:
+        return self.num_safe - self.revealed
+
+    @property
+    def over(self) -> bool:
+        return self.state != GameState.PLAYING
+
+    @property
+    def won(self) -> bool:
+        return self.state == GameState.WON
+
+    @property
+    def lost(self) -> bool:
+        return self.state == GameState.LOST
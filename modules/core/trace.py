@@ -0,0 +1,147 @@
+"""
+    Named spans, instant events and counters, for finding out where the time goes.
+
+    Tracing is off by default and then costs a check of trace.enabled. Call sites that
+    run per click or per frame check it themselves before building any arguments:
+
+        if trace.enabled:
+            trace.counter("reveal size", len(opened))
+
+    span() may be used unguarded, when disabled it hands back a shared context manager
+    that does nothing.
+
+    When enabled, events go to a ring buffer that keeps the last ring_size of them.
+    write_chrome_trace() saves it as Chrome trace JSON, which chrome://tracing and
+    https://ui.perfetto.dev open.
+"""
+import json
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+
+enabled: bool = False
+
+DEFAULT_RING_SIZE: int = 1 << 16
+
+# (phase, name, start in us, duration in us, thread id, args). Phases are Chrome's:
+# X a span, i an instant event, C a counter
+Event = Tuple[str, str, int, int, int, Optional[Dict[str, Any]]]
+
+_events: Deque[Event] = deque(maxlen=DEFAULT_RING_SIZE)
+
+
+def _now_us() -> int:
+    return time.perf_counter_ns() // 1000
+
+
+class _Span():
+    __slots__ = ("_name", "_args", "_start")
+
+    def __init__(self, name: str, args: Optional[Dict[str, Any]]):
+        self._name: str = name
+        self._args: Optional[Dict[str, Any]] = args
+        self._start: int = 0
+
+    def __enter__(self):
+        self._start = _now_us()
+        return self
+
+    def __exit__(self, *exc):
+        _events.append(("X", self._name, self._start, _now_us() - self._start, threading.get_ident(), self._args))
+        return False
+
+
+class _NullSpan():
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def enable(ring_size: int = DEFAULT_RING_SIZE):
+    """
+        Starts tracing into an empty ring buffer of ring_size events.
+    """
+    global enabled, _events
+    _events = deque(maxlen=ring_size)
+    enabled = True
+    return
+
+
+def disable():
+    """
+        Stops tracing. Events recorded so far are kept.
+    """
+    global enabled
+    enabled = False
+    return
+
+
+def span(name: str, **args):
+    """
+        Context manager timing the code it wraps.
+    """
+    if not enabled:
+        return _NULL_SPAN
+    return _Span(name, args or None)
+
+
+def instant(name: str, **args):
+    if not enabled:
+        return
+    _events.append(("i", name, _now_us(), 0, threading.get_ident(), args or None))
+    return
+
+
+def counter(name: str, value: float):
+    if not enabled:
+        return
+    _events.append(("C", name, _now_us(), 0, threading.get_ident(), {"value": value}))
+    return
+
+
+def events() -> List[Event]:
+    return list(_events)
+
+
+def clear():
+    _events.clear()
+    return
+
+
+def _json_default(o):
+    # numpy scalars, e.g. a count read straight from a board array
+    if hasattr(o, "item"):
+        return o.item()
+    return str(o)
+
+
+def write_chrome_trace(path: str):
+    """
+        Writes the ring buffer to path as Chrome trace JSON.
+    """
+    pid = os.getpid()
+    trace_events = []
+    for phase, name, ts, dur, tid, args in list(_events):
+        e: Dict[str, Any] = {"name": name, "ph": phase, "ts": ts, "pid": pid, "tid": tid}
+        if phase == "X":
+            e["dur"] = dur
+        elif phase == "i":
+            # Drawn on its own thread's track only
+            e["s"] = "t"
+        if args:
+            e["args"] = args
+        trace_events.append(e)
+
+    with open(path, "w") as f:
+        json.dump({"traceEvents": trace_events, "displayTimeUnit": "ms"}, f, default=_json_default)
+    return
@@ -14,11 +14,11 @@ class EventConfig():
                                                               pg.KEYUP,
                                                               pg.WINDOWENTER,
                                                               pg.WINDOWLEAVE,
-                                                              pg.WINDOWCLOSE]
-        print("Setting events allowed")
+                                                              pg.WINDOWCLOSE,
+                                                              pg.MOUSEWHEEL]
         pg.event.set_allowed(self._events_allowed)
         pg.event.set_blocked(pg.MOUSEMOTION)
-        self.mouse_buttons = [pg.BUTTON_LEFT, pg.BUTTON_RIGHT]
+        self.mouse_buttons = [pg.BUTTON_LEFT, pg.BUTTON_RIGHT, pg.BUTTON_MIDDLE]
         
         return
     
@@ -1,10 +1,11 @@
 from enum import Enum, auto
-import pygame as pg
 
+# Kept free of pygame so the headless core can use ActionType.
+# Values are pg.BUTTON_LEFT / BUTTON_MIDDLE / BUTTON_RIGHT - 1
 class MouseButtons(Enum):
-    LEFT    = pg.BUTTON_LEFT - 1
-    MIDDLE  = pg.BUTTON_MIDDLE - 1
-    RIGHT   = pg.BUTTON_RIGHT - 1
+    LEFT    = 0
+    MIDDLE  = 1
+    RIGHT   = 2
 
 class ActionType(Enum):
     REVEAL  = auto()
@@ -13,6 +14,11 @@ class ActionType(Enum):
     NONE    = auto()
     RESTART = auto()
     QUIT    = auto()
+    ZOOM_IN   = auto()
+    ZOOM_OUT  = auto()
+    PAN_START = auto()
+    PAN_END   = auto()
+    TOGGLE_HUD = auto()
 
 class EventType(Enum):
     EXIT  = auto()
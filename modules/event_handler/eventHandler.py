@@ -17,11 +17,17 @@ class EventHandler():
     EventParser = ep
     EventConfig = ec
     
-    def __init__(self):
+    def __init__(self, blocking_input: bool = False, drag_timeout_ms: int = 0):
         
         self.state = EventHandler.State() # Holds the current state of input
         self._event_function = pg.event.get
 
+        # Sleep on the event queue instead of polling it. While a button is held we
+        # only sleep up to drag_timeout_ms so DRAG actions keep coming.
+        self._blocking_input: bool = blocking_input
+        self._drag_timeout_ms: int = drag_timeout_ms
+        self._wait_function = pg.event.wait
+
         self.config = EventHandler.EventConfig()
        
         # Set generators
@@ -77,6 +83,48 @@ class EventHandler():
 
     def get_action(self) -> Action:
        return self._get_action()
+
+    def get_actions(self, wait: bool = True) -> List[Action]:
+        """
+            Drains the event queue once and returns every action parsed from it.
+
+            Consecutive DRAG actions are coalesced into the latest one. If nothing came in
+            while a button is held, a single DRAG at the current mouse position is returned.
+            The list is empty when there is nothing to do.
+
+            :param wait: In blocking mode, whether to sleep until something comes in. Pass
+                         False while the game still has work to do every frame
+        """
+        actions: List[Action] = []
+
+        for event in self._get_event_batch(wait):
+            self._parser.set_current_event(event)
+            if not self._parser.is_event_valid():
+                continue
+
+            action = self._parser.get_action_from_event()
+            if action == ActionType.NONE:
+                continue
+
+            coords, has_pos = self._parser.get_event_pos()
+            if not has_pos:
+                coords = self.get_mouse_pos()
+            self._add_action(actions, self._make_action(coords, action))
+
+        if not actions and self.state.mode == Mode.DRAG:
+            coords = self.get_mouse_pos()
+            self.state.pos = coords
+            actions.append(self._make_action(coords, ActionType.DRAG))
+
+        return actions
+
+    def _add_action(self, actions: List[Action], a: Action):
+        # Only the last position of a run of DRAG actions matters
+        if actions and a.action == ActionType.DRAG and actions[-1].action == ActionType.DRAG:
+            actions[-1] = a
+        else:
+            actions.append(a)
+        return
     
     def _get_action(self) -> Action:
         """
@@ -112,12 +160,13 @@ class EventHandler():
         if skip_event:
 
             # If no events. Then we just see if we are still in drag mode.
-            coords = self.get_mouse_pos()
-            self.state.pos = coords
-
+            # The mouse is only polled while a button is held.
             if self.state.mode == Mode.DRAG:
+                coords = self.get_mouse_pos()
+                self.state.pos = coords
                 action = ActionType.DRAG
             else:
+                coords = self.state.pos
                 action = ActionType.NONE
 
         return self._make_action(coords, action)
@@ -142,12 +191,43 @@ class EventHandler():
 
     def _get_event_gen(self) -> Iterator[pg.event.Event | None]:
         while True:
+            if self._blocking_input:
+                yield self._wait_for_event()
+                continue
+
             event_list = self._event_function()
             if len(event_list) == 0:
                 yield None
             for e in event_list:
                 yield e
     
+    def _get_event_batch(self, wait: bool = True) -> List[pg.event.Event]:
+        """
+            Everything currently in the queue. In blocking mode, first sleeps until at
+            least one event arrives (or the drag timeout passes), unless told not to wait.
+        """
+        if not self._blocking_input or not wait:
+            return self._event_function()
+
+        first = self._wait_for_event()
+        if first is None:
+            return []
+        return [first] + self._event_function()
+
+    def _wait_for_event(self) -> pg.event.Event | None:
+        """
+            Sleeps until an event arrives. In drag mode gives up after the drag timeout
+            and returns None, the same as an empty poll.
+        """
+        if self.state.mode == Mode.DRAG:
+            e = self._wait_function(self._drag_timeout_ms)
+        else:
+            e = self._wait_function()
+
+        if e.type == pg.NOEVENT:
+            return None
+        return e
+
     def _validate_coord(self, coord: Tuple[int, int]) -> bool:
         if( not isinstance(coord, tuple) or
             len(coord) != 2 or
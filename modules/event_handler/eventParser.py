@@ -27,6 +27,7 @@ class EventParser():
                 MOUSEMOTION       pos, rel, buttons, touch -> Ignore for right now
                 MOUSEBUTTONUP     pos, button, touch -> _parse_mouse_up
                 MOUSEBUTTONDOWN   pos, button, touch -> _parse_mouse_down
+                MOUSEWHEEL        x, y, flipped -> _mouse_wheel, zooms
 
             Window Events
                 WINDOWENTER            Mouse entered the window
@@ -41,7 +42,8 @@ class EventParser():
                 pg.KEYDOWN: self._key_down,
                 pg.KEYUP: self._key_up,
                 pg.WINDOWENTER: self._window_enter,
-                pg.WINDOWLEAVE: self._window_leave
+                pg.WINDOWLEAVE: self._window_leave,
+                pg.MOUSEWHEEL: self._mouse_wheel
             }
 
             for m in self._event_to_func_map:
@@ -86,15 +88,22 @@ class EventParser():
             self.state.right_button = True
             return ActionType.DRAG
 
+        def _parse_middle_mouse_down(self) -> ActionType:
+            assert not self.state.middle_button
+            self.state.middle_button = True
+            return ActionType.PAN_START
+
         def _mouse_down(self) -> ActionType:
             at: ActionType = ActionType.NONE
 
-            # Exclude middle mouse for now!
+            # Middle mouse pans the camera
             if self.event.button in self.config.mouse_buttons:
                 if self.event.button == pg.BUTTON_LEFT:
                     at = self._parse_left_mouse_down()
                 elif self.event.button == pg.BUTTON_RIGHT:
                     at =  self._parse_right_mouse_down()
+                elif self.event.button == pg.BUTTON_MIDDLE:
+                    at = self._parse_middle_mouse_down()
 
                 self.state.mode = Mode.DRAG
                 self.state.pos = self.event.pos
@@ -111,6 +120,11 @@ class EventParser():
             self.state.right_button = False
             return ActionType.FLAG
 
+        def _parse_middle_mouse_up(self) -> ActionType:
+            assert self.state.middle_button
+            self.state.middle_button = False
+            return ActionType.PAN_END
+
         def _mouse_up(self) -> ActionType:
             at: ActionType = ActionType.NONE
 
@@ -119,12 +133,22 @@ class EventParser():
                     at = self._parse_left_mouse_up()
                 elif self.event.button == pg.BUTTON_RIGHT:
                     at =  self._parse_right_mouse_up()
+                elif self.event.button == pg.BUTTON_MIDDLE:
+                    at = self._parse_middle_mouse_up()
 
                 self.state.pos = self.event.pos
                 self.state.mode = Mode.DRAG if self.state._mouse_down else Mode.NONE
 
             return at
         
+        def _mouse_wheel(self) -> ActionType:
+            # Wheel events carry no position, the handler zooms around the mouse
+            if self.event.y > 0:
+                return ActionType.ZOOM_IN
+            if self.event.y < 0:
+                return ActionType.ZOOM_OUT
+            return ActionType.NONE
+
         def _window_enter(self) -> ActionType:
             # Update mouse state. Depending on state of previous mouse,
             #   If mouse if pressed down, then we go into drag.
@@ -145,6 +169,10 @@ class EventParser():
             return self.get_event_type() in self.config.events_allowed
         
         def _key_down(self) -> ActionType:
+            if self.event.key == pg.K_r:
+                return ActionType.RESTART
+            if self.event.key == pg.K_F3:
+                return ActionType.TOGGLE_HUD
             return ActionType.NONE
         
         def _key_up(self) -> ActionType:
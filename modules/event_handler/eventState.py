@@ -9,6 +9,7 @@ class State:
         
         self._mouse_left_button: bool = False
         self._mouse_right_button: bool = False
+        self._mouse_middle_button: bool = False # Held while panning
         self.button_down = False
         
         self._mouse_pos: Tuple[int] = (0, 0)
@@ -43,7 +44,7 @@ class State:
     @left_button.setter
     def left_button(self, state: bool):
         if not state:
-            self._mouse_down = self._mouse_right_button
+            self._mouse_down = self._mouse_right_button or self._mouse_middle_button
         else:
             self.button_down = True
         
@@ -57,9 +58,23 @@ class State:
     @right_button.setter
     def right_button(self, state: bool):
         if not state:
-            self._mouse_down = self._mouse_left_button
+            self._mouse_down = self._mouse_left_button or self._mouse_middle_button
         else:
             self.button_down = True
         
         self._mouse_right_button = state
-        return
\ No newline at end of file
+        return
+
+    @property
+    def middle_button(self) -> bool:
+        return self._mouse_middle_button
+
+    @middle_button.setter
+    def middle_button(self, state: bool):
+        if not state:
+            self._mouse_down = self._mouse_left_button or self._mouse_right_button
+        else:
+            self.button_down = True
+
+        self._mouse_middle_button = state
+        return
@@ -0,0 +1,65 @@
+import pygame as pg
+from typing import Dict, Tuple
+
+from ..core.cell import Cell
+from ..core.enums import RevealColors, CellDisplayState
+
+
+class SurfaceAtlas():
+    """
+        Shared cache of cell images.
+
+        Only a handful of distinct cell images exist (one per RevealColors value in use),
+        so every cell with the same look and size shares a single Surface. Images are
+        made the first time they are asked for, and dropped when the cell size changes.
+    """
+    def __init__(self, cell_size: Tuple[int, int]):
+
+        self._cell_size: Tuple[int, int] = cell_size
+        self._surfaces: Dict[Tuple[CellDisplayState, int, Tuple[int, int]], pg.Surface] = {}
+
+        return
+
+    @property
+    def cell_size(self) -> Tuple[int, int]:
+        return self._cell_size
+
+    @cell_size.setter
+    def cell_size(self, size: Tuple[int, int]):
+        if size != self._cell_size:
+            self._cell_size = size
+            self.invalidate()
+        return
+
+    def invalidate(self):
+        self._surfaces.clear()
+        return
+
+    def __len__(self) -> int:
+        return len(self._surfaces)
+
+    def get(self, state: CellDisplayState, adjacent_mine_count: int = 0) -> pg.Surface:
+        """
+            :param adjacent_mine_count: Only used for revealed cells
+        """
+        if state != CellDisplayState.REVEALED:
+            adjacent_mine_count = 0
+
+        key = (state, adjacent_mine_count, self._cell_size)
+        surface = self._surfaces.get(key)
+        if surface is None:
+            surface = self._make_surface(state, adjacent_mine_count)
+            self._surfaces[key] = surface
+        return surface
+
+    def _make_surface(self, state: CellDisplayState, adjacent_mine_count: int) -> pg.Surface:
+        surface = pg.Surface(self._cell_size)
+
+        if state == CellDisplayState.REVEALED:
+            surface.fill(Cell.REVEAL_COLOR_LOOKUP_TABLE[adjacent_mine_count].value)
+        elif state == CellDisplayState.FLAGGED:
+            surface.fill(RevealColors.FLAGGED.value)
+        else:
+            surface.fill(RevealColors.NOT_REVEALED.value)
+
+        return surface
@@ -1,37 +1,194 @@
 from modules.settings import Settings
 from modules.event_handler.eventAction import Action, ActionType
 import pygame.surface
+from typing import List, Optional
+import os
 
 from .render import Render as Game_Render
-from .logic import Logic as Game_Logic
-from .grid import Grid as Game_Grid
+from ..core.game import CoreGame as Game_Core
+from ..core.logic import Logic as Game_Logic
+from ..core.grid import Grid as Game_Grid
 from modules.settings import Settings as Game_Settings
 from .config import Config as Game_Config
+from ..core.generator import BoardPool, BoardParams
+from ..core import savefile
+from ..core.actionlog import ActionRecorder
+from ..core import trace
+from ..core.perf import FrameStats
+import numpy as np
 
 
 class Game():
 
     Settings = Game_Settings
-    Grid = Game_Grid
     Render = Game_Render
-    Logic = Game_Logic
     Config = Game_Config
+    CoreGame = Game_Core
+
+    NO_GUESS_POOL_SIZE = 4
 
     def __init__(self, parent_screen: pygame.Surface):
         
         """
             Will contain ALL the game information / modules including logic and rendering modules
+
+            The game itself runs in the headless CoreGame. The renderer follows it as an observer.
         """
 
         self._settings: Settings = self.Settings()
+
+        # On before anything is built, so the trace covers start up
+        if self._settings.trace_path is not None:
+            trace.enable()
+
+        # A saved game decides the board size, so it is read before anything else
+        resume = self._settings.save_path is not None and os.path.exists(self._settings.save_path)
+        if resume:
+            self._settings = savefile.read_header(self._settings.save_path).settings(self._settings)
+
+        # Replays need the seed the game really used
+        if self._settings.action_log_path is not None and self._settings.seed is None:
+            self._settings.seed = int(np.random.SeedSequence().generate_state(1)[0])
+
         self._config: Game_Config = self.Config(parent_screen, self._settings)
-        self._grid: Game_Grid = self.Grid(self._config)
+
+        # No-guess boards come ready made from the pool, CoreGame takes them from there.
+        # Unless no_guess_pool_path keeps boards from the last session, the pool starts
+        # empty and the first game waits for its first board
+        self._board_pool: Optional[BoardPool] = None
+        if self._settings.no_guess:
+            self._board_pool = BoardPool(BoardParams.from_settings(self._settings), size=self.NO_GUESS_POOL_SIZE,
+                                         seed=self._settings.seed, path=self._settings.no_guess_pool_path,
+                                         workers=max(1, (os.cpu_count() or 1) - 1),
+                                         timeout=self._settings.no_guess_timeout)
+
+        self._core: Game_Core = self.CoreGame(self._settings, self._config, board_pool=self._board_pool)
+        if resume:
+            savefile.load_into(self._core, self._settings.save_path)
+
+        # A resumed game does not start from a board the log could rebuild, so it is not
+        # recorded. Nor is a no-guess game the pool had no board for in time
+        self._recorder: Optional[ActionRecorder] = None
+        mine_ids = self._grid_mine_ids() if self._settings.no_guess else None
+        if self._settings.action_log_path is not None and not resume and (mine_ids is not None
+                                                                            or not self._settings.no_guess):
+            self._recorder = ActionRecorder(self._settings.action_log_path, self._settings,
+                                            parent_screen.get_size(), mine_ids)
+        self._grid: Game_Grid = self._core.grid
+        self._logic: Game_Logic = self._core.logic
         self._renderer: Game_Render = self.Render(self._grid, self._config)
-        self._logic: Game_Logic = self.Logic(self._grid, self._config, self._renderer)
+        if self._settings.reveal_budget_ms is not None:
+            self._logic.reveal_budget = self._settings.reveal_budget_ms / 1000
+            self._renderer.update_budget = self._settings.reveal_budget_ms / 1000
+        self._core.add_observer(self._renderer)
+
+        self._frame_stats: FrameStats = FrameStats()
+        self._hud_visible: bool = self._settings.show_hud
+        return
+
+    @property
+    def busy(self) -> bool:
+        """
+            True while there is work left for the next frames, even with no input.
+        """
+        return self._logic.busy or self._renderer.busy
+
+    @property
+    def stats(self):
+        return self._core.stats
+
+    def update(self):
+        """
+            Per frame work that does not wait on input, like the rest of a big cascade.
+        """
+        if self._logic.busy:
+            with trace.span("continue reveal"):
+                self._logic.continue_reveal()
+        return
+
+    def close(self):
+        # Saves and logs see the board as the player does, with any cascade finished
+        self._logic.finish_reveal()
+        if self._board_pool is not None:
+            self._board_pool.close()
+        if self._settings.save_path is not None:
+            savefile.save_game(self._core, self._settings.save_path)
+        if self._recorder is not None:
+            self._recorder.close(self._core)
+        if self._settings.trace_path is not None:
+            trace.write_chrome_trace(self._settings.trace_path)
+        if self._settings.frame_histogram_path is not None:
+            self._frame_stats.histogram.write_percentile_distribution(self._settings.frame_histogram_path,
+                                                                      unit_scale=1000)
+        return
+
+    def record_frame(self, seconds: float, actions: int):
+        """
+            :param seconds: Time spent on the frame, applying actions and rendering, not
+                            waiting for input or the frame rate
+        """
+        self._frame_stats.record(seconds, actions)
         return
 
-    def game_render(self):
-        self._renderer.render()
+    def toggle_hud(self):
+        self._hud_visible = not self._hud_visible
+        return
+
+    def _hud_lines(self) -> List[str]:
+        frames = self._frame_stats
+        p50, p95, p99 = (1000 * s for s in frames.recent_percentiles([50, 95, 99]))
+        return [
+            f"frame ms  last {1000 * frames.last:.1f}  p50 {p50:.1f}  p95 {p95:.1f}  p99 {p99:.1f}",
+            f"session p99 {frames.histogram.percentiles([99])[0] / 1000:.1f} ms  max {frames.histogram.max / 1000:.1f} ms",
+            f"actions/s {frames.actions_per_second()}",
+            f"cells drawn {self._renderer.cells_drawn}  queued {self._renderer.queue_size}",
+            f"cascade {self._logic.cascade_size}" + ("  revealing" if self._logic.busy else ""),
+        ]
+
+    def game_render(self) -> List[pygame.Rect]:
+        self._renderer.hud_lines = self._hud_lines() if self._hud_visible else None
+        return self._renderer.render()
+
+    def restart(self):
+        """
+            Starts a new game on the existing board, renderer and surfaces.
+
+            No-guess boards come from the pool, which generates them in the background
+            during play, so a restart is a reset of the board buffers plus a copy of the
+            next board's mines into them. Restarting faster than the pool refills waits
+            for its next board.
+        """
+        if self._board_pool is None:
+            self.apply_action(Action(action=ActionType.RESTART, coords=(0, 0)))
+            return
+
+        # A replay can't rebuild a pool board, so the log ends with the game before it
+        if self._recorder is not None:
+            self._recorder.close(self._core)
+            self._recorder = None
+        self._core.restart()
+        return
+
+    def _grid_mine_ids(self) -> Optional[np.ndarray]:
+        grid = self._core.grid
+        return grid.metadata.mine_ids if grid.mines_placed else None
 
     def apply_action(self, a: Action):
-        self._logic.update_board(a)
+        # The overlay is not part of the game, so not recorded
+        if a.action == ActionType.TOGGLE_HUD:
+            self.toggle_hud()
+            return
+        if a.action == ActionType.RESTART and self._board_pool is not None:
+            self.restart()
+            return
+        if self._recorder is not None:
+            self._recorder.record(a)
+        self._core.apply_action(a)
+
+    def apply_actions(self, batch: List[Action]):
+        """
+            Applies a whole batch of actions. Meant to be followed by a single render.
+        """
+        for a in batch:
+            self.apply_action(a)
+        return
@@ -0,0 +1,58 @@
+import pygame as pg
+from typing import Dict, List, Tuple
+
+
+class Hud():
+    """
+        Lines of text in a box in the top left corner of the screen, over the board.
+
+        Text is put together from cached glyph surfaces, one per character, so once every
+        character has been seen a frame costs one blit per character and no font rendering.
+        The box only grows while shown, so a shorter line never leaves stale text behind.
+    """
+    FONT_SIZE: int = 20
+    PADDING: int = 4
+    COLOR: Tuple[int, int, int] = (255, 255, 255)
+    BACKGROUND: Tuple[int, int, int] = (0, 0, 0)
+
+    def __init__(self):
+
+        if not pg.font.get_init():
+            pg.font.init()
+        self._font: pg.font.Font = pg.font.Font(None, self.FONT_SIZE)
+        self._line_height: int = self._font.get_linesize()
+        self._glyphs: Dict[str, pg.Surface] = {}
+
+        # Smallest box every line drawn so far fits in
+        self._size: Tuple[int, int] = (0, 0)
+        return
+
+    def _glyph(self, ch: str) -> pg.Surface:
+        glyph = self._glyphs.get(ch)
+        if glyph is None:
+            glyph = self._font.render(ch, True, self.COLOR, self.BACKGROUND)
+            self._glyphs[ch] = glyph
+        return glyph
+
+    def reset(self):
+        self._size = (0, 0)
+        return
+
+    def draw(self, screen: pg.Surface, lines: List[str]) -> pg.Rect:
+        """
+            :return: Screen rect drawn to
+        """
+        glyph_lines = [[self._glyph(ch) for ch in line] for line in lines]
+        width = max((sum(g.get_width() for g in gl) for gl in glyph_lines), default=0)
+        self._size = (max(self._size[0], width + 2 * self.PADDING),
+                      max(self._size[1], len(lines) * self._line_height + 2 * self.PADDING))
+
+        rect = screen.fill(self.BACKGROUND, pg.Rect((0, 0), self._size))
+        y = self.PADDING
+        for gl in glyph_lines:
+            x = self.PADDING
+            for g in gl:
+                screen.blit(g, (x, y))
+                x += g.get_width()
+            y += self._line_height
+        return rect
@@ -0,0 +1,164 @@
+import pygame as pg
+import numpy as np
+import time
+from typing import Iterable, List, Optional, Tuple
+
+from ..core.board import Board, MINE_ADJACENT_VALUE
+from ..core.camera import Camera
+from ..core.enums import RevealColors
+
+
+# Colors by state index: adjacent count (mines included) when revealed, then flagged, then hidden
+FLAGGED_INDEX: int = MINE_ADJACENT_VALUE + 1
+HIDDEN_INDEX: int = MINE_ADJACENT_VALUE + 2
+STATE_COLORS: np.ndarray = np.array([c.value for c in list(RevealColors)[:MINE_ADJACENT_VALUE + 1]]
+                                    + [RevealColors.FLAGGED.value, RevealColors.NOT_REVEALED.value], dtype=np.uint32)
+
+
+class LodImage():
+    """
+        Zoomed out picture of the board, one pixel per block of cells.
+
+        Blocks are block_size x block_size cells, and as small as max_size allows, down to
+        a single cell. A block's pixel is the average color of its cells. Changed cells only
+        queue their blocks, their pixels are worked out again on the next draws straight
+        from the board's state arrays, as many as a draw's deadline leaves time for.
+
+        Drawing scales the visible part of the image to the screen with a single blit, so
+        it costs the same however many cells are on screen.
+    """
+    # Cells looked at per numpy pass when updating, small enough to check the clock often
+    UPDATE_BATCH_CELLS: int = 1 << 13
+
+    def __init__(self, board: Board, max_size: int = 2048):
+
+        self._board: Board = board
+
+        rows, cols = board.num_rows, board.num_columns
+        self.block_size: int = max(1, -(-max(rows, cols) // max_size))
+        b = self.block_size
+        self.num_block_rows: int = -(-rows // b)
+        self.num_block_columns: int = -(-cols // b)
+
+        self.surface: pg.Surface = pg.Surface((self.num_block_columns, self.num_block_rows), depth=32)
+        self.surface.fill(RevealColors.NOT_REVEALED.value)
+
+        # Blocks whose pixel is out of date, flagged in _dirty so each is queued once. The
+        # queue holds arrays of block ids, block row * num_block_columns + block column.
+        # Everything is out of date until the first draws
+        num_blocks = self.num_block_rows * self.num_block_columns
+        self._dirty: np.ndarray = np.ones(num_blocks, dtype=np.bool_)
+        self._queue: List[np.ndarray] = [np.arange(num_blocks)]
+
+        return
+
+    @property
+    def busy(self) -> bool:
+        """
+            True while some pixels are out of date, until enough draws have run.
+        """
+        return bool(self._queue)
+
+    def _queue_blocks(self, blocks: np.ndarray):
+        blocks = blocks[~self._dirty[blocks]]
+        if self.block_size > 1:
+            # Cells of one block
+            blocks = np.unique(blocks)
+        if len(blocks):
+            self._dirty[blocks] = True
+            self._queue.append(blocks)
+        return
+
+    def cells_changed(self, cell_ids: Iterable[int]):
+        ids = np.fromiter(cell_ids, dtype=np.int64)
+        if len(ids) == 0:
+            return
+        r, c = np.divmod(ids, self._board.num_columns)
+        self._queue_blocks(r // self.block_size * self.num_block_columns + c // self.block_size)
+        return
+
+    def spans_changed(self, spans: Iterable[Tuple[int, int, int]]):
+        spans = np.array(spans, dtype=np.int64).reshape(-1, 3)
+        if len(spans) == 0:
+            return
+        b = self.block_size
+        first = spans[:, 0] // b * self.num_block_columns + spans[:, 1] // b
+        counts = (spans[:, 2] - 1) // b + 1 - spans[:, 1] // b
+
+        # Every block from first on, counts of them, for each span
+        starts = np.cumsum(counts) - counts
+        self._queue_blocks(np.repeat(first - starts, counts) + np.arange(int(counts.sum())))
+        return
+
+    def board_reset(self):
+        # Every cell is hidden, so is every block
+        self.surface.fill(RevealColors.NOT_REVEALED.value)
+        self._dirty[:] = False
+        self._queue.clear()
+        return
+
+    def _update(self, deadline: Optional[float]):
+        """
+            Works out the pixels of the queued blocks, UPDATE_BATCH_CELLS cells at a time,
+            until the queue is empty or time.perf_counter() passes deadline. None runs until
+            the queue is empty.
+        """
+        board = self._board
+        rows, cols = board.num_rows, board.num_columns
+        b = self.block_size
+
+        # Cell offsets inside a block, row major
+        offset_r, offset_c = np.divmod(np.arange(b * b), b)
+        batch = max(1, self.UPDATE_BATCH_CELLS // (b * b))
+
+        pixels = pg.surfarray.pixels3d(self.surface)
+        while self._queue:
+            blocks = self._queue[0][:batch]
+            if len(blocks) == len(self._queue[0]):
+                self._queue.pop(0)
+            else:
+                self._queue[0] = self._queue[0][batch:]
+            self._dirty[blocks] = False
+
+            br, bc = np.divmod(blocks, self.num_block_columns)
+            r = br[:, None] * b + offset_r
+            c = bc[:, None] * b + offset_c
+
+            # Blocks along the bottom and right edges can hang off the board
+            inside = (r < rows) & (c < cols)
+            ids = np.where(inside, r * cols + c, 0)
+            state = np.where(board.revealed[ids], board.adjacent[ids],
+                             np.where(board.flagged[ids], FLAGGED_INDEX, HIDDEN_INDEX))
+
+            colors = (STATE_COLORS[state] * inside[:, :, None]).sum(axis=1)
+            pixels[bc, br] = colors // inside.sum(axis=1)[:, None]
+
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+
+        del pixels
+        return
+
+    def draw(self, screen: pg.Surface, camera: Camera, deadline: Optional[float] = None) -> pg.Rect:
+        """
+            Draws the part of the board the camera shows, over whatever is on screen.
+            Pixels still out of date at deadline, a time.perf_counter() value, are left
+            for the next draws and shown as they were.
+
+            :return: Screen rect drawn to
+        """
+        self._update(deadline)
+
+        b = self.block_size
+        r0, r1, c0, c1 = camera.visible_cells(self._board.num_rows, self._board.num_columns)
+        if r0 == r1 or c0 == c1:
+            return pg.Rect(0, 0, 0, 0)
+
+        # Whole blocks covering the visible cells
+        br0, br1 = r0 // b, -(-r1 // b)
+        bc0, bc1 = c0 // b, -(-c1 // b)
+        x0, y0 = camera.cell_to_screen(br0 * b, bc0 * b)
+        x1, y1 = camera.cell_to_screen(br1 * b, bc1 * b)
+
+        part = self.surface.subsurface(pg.Rect(bc0, br0, bc1 - bc0, br1 - br0))
+        return screen.blit(pg.transform.scale(part, (max(1, x1 - x0), max(1, y1 - y0))), (x0, y0))
@@ -1,38 +1,301 @@
-from .grid import Grid
+from ..core.grid import Grid
+from ..core.observer import BoardObserver
+from ..core import trace
 from .config import Config
-from .cell import MineCell
+from ..core.camera import Camera
+from .atlas import SurfaceAtlas
+from .lod import LodImage
+from .hud import Hud
+from ..core.enums import RevealColors, CellDisplayState
+from typing import Iterable, List, Optional, Tuple
+import numpy as np
 import pygame as pg
+import time
+
+class Render(BoardObserver):
+    """
+        Draws the board onto the parent screen. Follows the game as a BoardObserver.
+
+        Only cells inside the camera's view are drawn, so the cost of a frame follows the
+        number of visible cells rather than the size of the board. Once cells get smaller
+        than LOD_CELL_SIZE pixels, the board is drawn from a LodImage instead, which costs
+        the same at any zoom.
+    """
+
+    # Cells smaller than this, in pixels, are drawn from the LodImage
+    LOD_CELL_SIZE: int = 4
 
-class Render():
     def __init__(self, grid: Grid, config: Config):
 
         self._parent_screen = config.parent_screen
-        self._grid = Grid
+        self._grid: Grid = grid
+        self._config: Config = config
+        self._camera: Camera = config.camera
+
+        # Cell images shared by every cell
+        self._atlas: SurfaceAtlas = SurfaceAtlas(self._camera.cell_size)
+
+        # Picture of the whole board for zoomed out views. Kept up to date in either mode,
+        # so switching to it is cheap
+        self._lod: LodImage = LodImage(grid.cells)
+
+        # Seconds per frame spent bringing the zoomed out picture up to date, the rest is
+        # left for the next frames. None brings it up to date every frame. Zoomed in, the
+        # work of a frame is bounded by the cells on screen instead
+        self.update_budget: Optional[float] = None
+
+        # Camera view the screen was last drawn with
+        self._view: Tuple[int, int, int, int, int] = self._camera.view
 
-        self._to_render: pg.sprite.Group = pg.sprite.Group()
-        self._mines: pg.sprite.Group = pg.sprite.Group()
+        # Ids of the cells that need to be drawn next frame
+        self._to_render: List[int] = []
 
-        for r in range(0, config.num_rows):
-            for c in range(0, config.num_columns):
-                self._to_render.add(grid.board[r][c])
-                if isinstance(grid.board[r][c], MineCell):
-                    self._mines.add(grid.board[r][c])
+        # (row, start column, end column) spans of revealed cells that need to be drawn
+        self._spans_to_render: List[Tuple[int, int, int]] = []
 
+        # First frame draws the whole board
+        self._full_redraw: bool = True
 
+        # Screen areas drawn during the current frame
+        self._dirty_rects: List[pg.Rect] = []
+
+        # Figures about the last frame, for the performance overlay. Cells filled in one
+        # go count as well as cells drawn one by one
+        self.cells_drawn: int = 0
+        self.queue_size: int = 0
+
+        # Overlay text, drawn over the board every frame. None hides the overlay
+        self.hud_lines: Optional[List[str]] = None
+        self._hud: Optional[Hud] = None
+        self._hud_shown: bool = False
 
         return
-    
-    def add_sprite_to_render_queue(self, c: pg.surface.Surface):
-        self._to_render.add(c)
+
+    def add_cell_to_render_queue(self, cell_id: int):
+        self._to_render.append(cell_id)
+        self._lod.cells_changed([cell_id])
+        return True
+
+    def add_cells_to_render_queue(self, cell_ids: Iterable[int]):
+        start = len(self._to_render)
+        self._to_render.extend(cell_ids)
+        self._lod.cells_changed(self._to_render[start:])
+        return True
+
+    def add_spans_to_render_queue(self, spans: Iterable[Tuple[int, int, int]]):
+        start = len(self._spans_to_render)
+        self._spans_to_render.extend(spans)
+        self._lod.spans_changed(self._spans_to_render[start:])
         return True
 
+    @property
+    def busy(self) -> bool:
+        """
+            True while the zoomed out picture on screen is behind the board, and more
+            frames are needed to catch up.
+        """
+        return self._lod.busy and self._use_lod()
+
+    def request_full_redraw(self):
+        self._full_redraw = True
+        return
+
+    # BoardObserver
+    def cells_changed(self, cell_ids: Iterable[int]):
+        self.add_cells_to_render_queue(cell_ids)
+        return
+
+    def spans_changed(self, spans: Iterable[Tuple[int, int, int]]):
+        self.add_spans_to_render_queue(spans)
+        return
+
+    def board_reset(self):
+        # Everything is drawn again, the queued cells are part of that
+        self._to_render.clear()
+        self._spans_to_render.clear()
+        self._lod.board_reset()
+        self.request_full_redraw()
+        return
+
+    def _cell_rect(self, cell_id: int) -> pg.Rect:
+        r, c = self._grid.cells.id_to_grid_coords(cell_id)
+        x, y = self._camera.cell_to_screen(r, c)
+        return pg.Rect(x, y, self._camera.cell_width, self._camera.cell_height)
+
+    def _cell_surface(self, cell_id: int) -> pg.Surface:
+        cells = self._grid.cells
+        if cells.revealed[cell_id]:
+            return self._atlas.get(CellDisplayState.REVEALED, int(cells.adjacent[cell_id]))
+        if cells.flagged[cell_id]:
+            return self._atlas.get(CellDisplayState.FLAGGED)
+        return self._atlas.get(CellDisplayState.HIDDEN)
+
+    def _draw_cell(self, cell_id: int):
+        self._dirty_rects.append(self._parent_screen.blit(self._cell_surface(cell_id), self._cell_rect(cell_id)))
+        return
+
+    def _check_camera(self):
+        """
+            Cached cell images are only valid for one size, and everything on screen moves
+            when the camera does. If the view changed since the last frame, drop the images
+            if needed and redraw the whole view.
+        """
+        view = self._camera.view
+        if view != self._view:
+            self._view = view
+            self._atlas.cell_size = self._camera.cell_size
+            self.request_full_redraw()
+        return
+
+    def _check_hud(self):
+        # The board under a hidden overlay has to be drawn again
+        shown = self.hud_lines is not None
+        if shown and self._hud is None:
+            self._hud = Hud()
+        if shown != self._hud_shown:
+            self._hud_shown = shown
+            self._hud.reset()
+            if not shown:
+                self.request_full_redraw()
+        return
+
+    def _visible_cells(self) -> Tuple[int, int, int, int]:
+        cells = self._grid.cells
+        return self._camera.visible_cells(cells.num_rows, cells.num_columns)
+
+    def _draw_cells(self, cell_ids: List[int], visible: Tuple[int, int, int, int]):
+        # Only the queued cells that are on screen
+        r0, r1, c0, c1 = visible
+        ids = np.asarray(cell_ids, dtype=np.int64)
+        r, c = np.divmod(ids, self._grid.cells.num_columns)
+        visible_ids = ids[(r >= r0) & (r < r1) & (c >= c0) & (c < c1)].tolist()
+        self.cells_drawn += len(visible_ids)
+        for cell_id in visible_ids:
+            self._draw_cell(cell_id)
+        return
+
+    def _draw_span(self, r: int, c0: int, c1: int, visible: Tuple[int, int, int, int]):
+        """
+            Draws the visible part of a span of revealed cells as one ZERO colored rect,
+            then draws the numbered cells inside it on top.
+        """
+        vr0, vr1, vc0, vc1 = visible
+        c0 = max(c0, vc0)
+        c1 = min(c1, vc1)
+        if not vr0 <= r < vr1 or c0 >= c1:
+            return
+
+        w = self._camera.cell_width
+        h = self._camera.cell_height
+        x, y = self._camera.cell_to_screen(r, c0)
+        self.cells_drawn += c1 - c0
+        self._dirty_rects.append(self._parent_screen.fill(RevealColors.ZERO.value, pg.Rect(x, y, (c1 - c0) * w, h)))
+
+        row = r * self._grid.cells.num_columns
+        for i in np.flatnonzero(self._grid.cells.adjacent[row + c0:row + c1]):
+            self._draw_cell(row + c0 + int(i))
+        return
+
+    def _draw_board(self):
+        """
+            Redraws the whole screen. Unrevealed, unflagged cells all look the same, so
+            the visible part of the board is a single fill. Only the visible cells that
+            differ from it are drawn on top.
+        """
+        cells = self._grid.cells
+        screen_rect = self._parent_screen.get_rect()
+        self._parent_screen.fill(RevealColors.BLACK.value, screen_rect)
+
+        r0, r1, c0, c1 = self._visible_cells()
+        self.cells_drawn = (r1 - r0) * (c1 - c0)
+        x, y = self._camera.cell_to_screen(r0, c0)
+        self._parent_screen.fill(RevealColors.NOT_REVEALED.value,
+                                 pg.Rect(x, y, (c1 - c0) * self._camera.cell_width, (r1 - r0) * self._camera.cell_height))
+
+        shape = (cells.num_rows, cells.num_columns)
+        window = (slice(r0, r1), slice(c0, c1))
+        differs = cells.revealed.reshape(shape)[window] | cells.flagged.reshape(shape)[window]
+        for r, c in zip(*np.nonzero(differs)):
+            self._draw_cell((r0 + int(r)) * cells.num_columns + c0 + int(c))
+
+        # Everything drawn above is on screen
+        self._dirty_rects = [screen_rect]
+        return
+
+    def _use_lod(self) -> bool:
+        camera = self._camera
+        return camera.cells_per_pixel > 1 or min(camera.cell_size) < self.LOD_CELL_SIZE
+
+    def _draw_lod(self):
+        screen_rect = self._parent_screen.get_rect()
+        self._parent_screen.fill(RevealColors.BLACK.value, screen_rect)
+        deadline = None if self.update_budget is None else time.perf_counter() + self.update_budget
+        self._lod.draw(self._parent_screen, self._camera, deadline)
+        r0, r1, c0, c1 = self._visible_cells()
+        self.cells_drawn = (r1 - r0) * (c1 - c0)
+        self._dirty_rects = [screen_rect]
+        return
+
     def render_all_mines(self):
-        self._mines.draw(self._parent_screen)
+        cells = self._grid.cells
+        r0, r1, c0, c1 = self._visible_cells()
+        window = cells.mines.reshape(cells.num_rows, cells.num_columns)[r0:r1, c0:c1]
+        for r, c in zip(*np.nonzero(window)):
+            cell_id = (r0 + int(r)) * cells.num_columns + c0 + int(c)
+            self._dirty_rects.append(self._parent_screen.fill(RevealColors.MINE.value, self._cell_rect(cell_id)))
         return
 
+    # Past this many rects, a single bounding rect is cheaper to hand to the display
+    MAX_DIRTY_RECTS: int = 256
 
-    def render(self):
-        self._to_render.draw(self._parent_screen)
-        self._to_render.empty()
+    def _draw_queued(self):
+        # Past as many changes as the view holds cells, redrawing the whole view is cheaper
+        visible = self._visible_cells()
+        r0, r1, c0, c1 = visible
+        if len(self._to_render) + len(self._spans_to_render) > (r1 - r0) * (c1 - c0):
+            self._full_redraw = True
+
+        if self._full_redraw:
+            self._draw_board()
+            self._full_redraw = False
+        else:
+            if self._to_render:
+                self._draw_cells(self._to_render, visible)
+            for r, c0, c1 in self._spans_to_render:
+                self._draw_span(r, c0, c1, visible)
         return
 
+    def render(self) -> List[pg.Rect]:
+        """
+            Draws everything queued since the last frame.
+
+            :return: Screen rects that changed. Empty if nothing was drawn, in which case
+                     the display does not need updating.
+        """
+        with trace.span("render"):
+            self._check_camera()
+            self._check_hud()
+            self.cells_drawn = 0
+            self.queue_size = len(self._to_render) + len(self._spans_to_render)
+
+            if self._use_lod():
+                # Any change redraws the whole view, from the image
+                if self._full_redraw or self._to_render or self._spans_to_render or self._lod.busy:
+                    self._draw_lod()
+                self._full_redraw = False
+            else:
+                self._draw_queued()
+            self._to_render.clear()
+            self._spans_to_render.clear()
+
+            if self.hud_lines is not None:
+                self._dirty_rects.append(self._hud.draw(self._parent_screen, self.hud_lines))
+
+            dirty = self._dirty_rects
+            self._dirty_rects = []
+            if len(dirty) > self.MAX_DIRTY_RECTS:
+                dirty = [dirty[0].unionall(dirty)]
+
+        if trace.enabled:
+            trace.counter("dirty rects", len(dirty))
+        return dirty
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import Optional
 
 @dataclass
 class Settings:
@@ -6,8 +7,28 @@ class Settings:
     num_columns: int = 20
     grid_width: int = 1080
     grid_height: int = 800
-    cell_height = None
-    cell_width = None
+    cell_height: Optional[int] = None
+    cell_width: Optional[int] = None
     frame_rate: int = 240
+    blocking_input: bool = True
     num_mines: int = 50
-    seed = None
\ No newline at end of file
+    span_reveal: bool = True
+    # Big cascades are spread over frames, with this many ms of reveal work per frame and as
+    # many again bringing the zoomed out picture up to date. None does all of it in one go
+    reveal_budget_ms: Optional[float] = 4.0
+    seed: Optional[int] = None
+    no_guess: bool = False
+    no_guess_timeout: float = 10.0
+    # Spare no-guess boards are kept here between sessions. None keeps them in memory only,
+    # and the first game of a session then waits for its board to be generated
+    no_guess_pool_path: Optional[str] = None
+    # Resume from this save on start, if it exists, and save to it on exit
+    save_path: Optional[str] = None
+    # Record every action to this log, see modules/core/actionlog.py
+    action_log_path: Optional[str] = None
+    # Trace spans and counters, written here as Chrome trace JSON on exit, see modules/core/trace.py
+    trace_path: Optional[str] = None
+    # Performance overlay, toggled with F3
+    show_hud: bool = False
+    # Frame time histogram, written here on exit in HdrHistogram's text format
+    frame_histogram_path: Optional[str] = None
@@ -0,0 +1,54 @@
+"""
+    Replays recorded action logs against the headless game, much faster than real time.
+
+    Record a game by setting Settings.action_log_path, then:
+        python replay.py game.mswl
+        python replay.py logs/*.mswl --check
+
+    Logs are spread across every core. With --check, a log whose final board does not
+    match its recorded hash is reported and the exit status is 1.
+"""
+import argparse
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from modules.core.actionlog import replay_file
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("logs", nargs="+")
+    parser.add_argument("--check", action="store_true", help="Compare final boards with the recorded hashes")
+    parser.add_argument("--workers", type=int, default=None, help="Defaults to one per core")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    actions = 0
+    mismatches = 0
+    unchecked = 0
+
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        for path, count, seconds, matched in pool.map(partial(replay_file, check=args.check), args.logs):
+            actions += count
+            if matched is False:
+                mismatches += 1
+                print(f"MISMATCH {path}", flush=True)
+            elif matched is None and args.check:
+                unchecked += 1
+                print(f"no final hash, not checked: {path}", flush=True)
+
+    elapsed = time.perf_counter() - start
+    print(f"logs      {len(args.logs)}")
+    print(f"actions   {actions}, {actions / elapsed:.0f} actions/s")
+    if args.check:
+        print(f"mismatch  {mismatches}")
+        print(f"unchecked {unchecked}")
+    print(f"time      {elapsed:.1f}s")
+
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
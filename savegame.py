@@ -0,0 +1,45 @@
+"""
+    Tools for binary save files.
+
+    Convert a text mine list of "r c" lines into a save of an unplayed game:
+        python savegame.py import mine_ids.txt game.msav --rows 20 --columns 20
+
+    Show what a save holds:
+        python savegame.py info game.msav
+"""
+import argparse
+
+from modules.settings import Settings
+from modules.core.savefile import import_mine_ids_text, read_header
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    import_parser = sub.add_parser("import", help="Convert a text mine list into a save")
+    import_parser.add_argument("text")
+    import_parser.add_argument("save")
+    import_parser.add_argument("--rows", type=int, default=Settings.num_rows)
+    import_parser.add_argument("--columns", type=int, default=Settings.num_columns)
+    import_parser.add_argument("--seed", type=int, default=None)
+
+    info_parser = sub.add_parser("info", help="Print the header of a save")
+    info_parser.add_argument("save")
+    args = parser.parse_args()
+
+    if args.command == "import":
+        import_mine_ids_text(args.text, args.save, Settings(num_rows=args.rows, num_columns=args.columns,
+                                                            seed=args.seed))
+
+    header = read_header(args.save)
+    print(f"board     {header.num_rows}x{header.num_columns}, {header.num_mines} mines")
+    print(f"seed      {header.seed}")
+    print(f"placed    {header.mines_placed}")
+    print(f"revealed  {header.num_revealed}")
+    print(f"flags     {header.num_flags}")
+    return
+
+
+if __name__ == "__main__":
+    main()
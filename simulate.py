@@ -0,0 +1,68 @@
+"""
+    Plays many seeded games headless to estimate win rates for generator settings.
+
+    Games are sharded across every core. Each game only depends on its own seed, so the
+    totals are the same for any worker count.
+
+    Example, expert boards:
+        python simulate.py --rows 16 --columns 30 --density 0.20625 --seeds 0 10000
+"""
+import argparse
+import time
+
+from modules.core.simulation import GuessPolicy, SimulationParams, simulate
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=16)
+    parser.add_argument("--columns", type=int, default=30)
+    parser.add_argument("--density", type=float, default=0.20625, help="Fraction of cells that are mines")
+    parser.add_argument("--seeds", type=int, nargs=2, default=[0, 1000], metavar=("START", "STOP"),
+                        help="One game per seed in [START, STOP)")
+    parser.add_argument("--policy", choices=[p.value for p in GuessPolicy], default=GuessPolicy.SAFEST.value,
+                        help="How to guess when the solver is stuck")
+    parser.add_argument("--workers", type=int, default=None, help="Defaults to one per core")
+    parser.add_argument("--shard-size", type=int, default=64, help="Games per task sent to a worker")
+    parser.add_argument("--records", default=None, help="Write one CSV line per game to this file")
+    args = parser.parse_args()
+
+    params = SimulationParams(num_rows=args.rows, num_columns=args.columns,
+                              num_mines=int(args.rows * args.columns * args.density),
+                              policy=GuessPolicy(args.policy))
+    seeds = range(args.seeds[0], args.seeds[1])
+
+    records_file = open(args.records, "w") if args.records is not None else None
+    if records_file is not None:
+        records_file.write("seed,won,guesses,revealed\n")
+
+    done = 0
+    start = time.perf_counter()
+
+    def on_record(record):
+        nonlocal done
+        done += 1
+        if records_file is not None:
+            records_file.write(",".join(str(v) for v in record) + "\n")
+        if done % 1000 == 0:
+            print(f"{done}/{len(seeds)} games, {done / (time.perf_counter() - start):.0f} games/s", flush=True)
+        return
+
+    try:
+        results = simulate(params, seeds, args.workers, args.shard_size, on_record)
+    finally:
+        if records_file is not None:
+            records_file.close()
+
+    elapsed = time.perf_counter() - start
+    print(f"board {params.num_rows}x{params.num_columns}, {params.num_mines} mines, policy {params.policy.value}")
+    print(f"games              {results.games}")
+    print(f"win rate           {results.win_rate:.4f} +- {results.win_rate_stderr:.4f}")
+    print(f"first guess losses {results.first_guess_losses}")
+    print(f"guesses per game   {results.guesses / max(1, results.games):.2f}")
+    print(f"time               {elapsed:.1f}s, {results.games / elapsed:.0f} games/s")
+    return
+
+
+if __name__ == "__main__":
+    main()